@@ -9,6 +9,7 @@ to avoid being blocked by external services.
 import sys
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
 # Add scripts directory to path
@@ -27,6 +28,11 @@ from utils.http_client import (
 )
 
 
+def fake_resp(code: int = 200) -> SimpleNamespace:
+    """Fixed-shape response stub; far cheaper than building nested Mocks."""
+    return SimpleNamespace(status_code=code, raise_for_status=lambda: None)
+
+
 class TestUserAgentConstants(unittest.TestCase):
     """Test that User-Agent constants are properly defined."""
 
@@ -69,7 +75,7 @@ class TestCreateSession(unittest.TestCase):
         session = create_session()
         self.assertIn("Accept", session.headers)
         self.assertIn("Accept-Language", session.headers)
-        self.assertIn("DNT", session.headers)
+        self.assertIn("Accept-Encoding", session.headers)
 
     def test_custom_user_agent(self):
         """Should accept custom User-Agent."""
@@ -100,7 +106,7 @@ class TestConfScoutHTTPClient(unittest.TestCase):
         client = ConfScoutHTTPClient()
         
         # Mock the session.get method
-        client.session.get = Mock(return_value=Mock(status_code=200))
+        client.session.get = Mock(return_value=fake_resp())
         
         client.get("http://example.com")
         self.assertEqual(client.request_count, 1)
@@ -119,7 +125,7 @@ class TestConfScoutHTTPClient(unittest.TestCase):
     @patch('utils.http_client.get_with_retry')
     def test_get_with_retry(self, mock_retry):
         """get_with_retry should delegate to utility function."""
-        mock_retry.return_value = Mock(status_code=200)
+        mock_retry.return_value = fake_resp()
         
         client = ConfScoutHTTPClient()
         response = client.get_with_retry("http://example.com", max_retries=5)
@@ -154,27 +160,27 @@ class TestNominatimHTTPClient(unittest.TestCase):
         self.assertEqual(client.session.headers["User-Agent"], NOMINATIM_USER_AGENT)
         client.close()
 
-    @patch('time.time')
-    @patch('time.sleep')
-    def test_rate_limiting(self, mock_sleep, mock_time):
-        """Nominatim client should enforce 1 second delay between requests."""
-        # Provide four time values: first call (init), second call (after first get), 
-        # third call (before second get), fourth call (after second get)
-        mock_time.side_effect = [1.0, 1.0, 1.5, 2.5]
+    def test_rate_limiting(self):
+        """Every Nominatim request must draw from the shared token bucket."""
+        from utils import http_client
 
         client = NominatimHTTPClient()
-        client.session.get = Mock(return_value=Mock(status_code=200))
-
-        # First request - no sleep needed
-        client.get("http://example.com")
-        mock_sleep.assert_not_called()
+        client.session.get = Mock(return_value=fake_resp())
 
-        # Second request - should sleep for remaining time (0.5s)
-        client.get("http://example.com")
-        mock_sleep.assert_called_once_with(0.5)
+        with patch.object(http_client._nominatim_bucket, "consume") as mock_consume:
+            client.get("http://example.com")
+            client.get("http://example.com")
 
+        self.assertEqual(mock_consume.call_count, 2)
         client.close()
 
+    def test_shared_bucket_rate(self):
+        """The shared bucket should allow 1 request per second in aggregate."""
+        from utils.http_client import _nominatim_bucket
+
+        self.assertEqual(_nominatim_bucket.rate, 1.0)
+        self.assertEqual(_nominatim_bucket.capacity, 1)
+
 
 class TestGetWithRetry(unittest.TestCase):
     """Test get_with_retry function."""
@@ -183,7 +189,7 @@ class TestGetWithRetry(unittest.TestCase):
     @patch('time.sleep')
     def test_success_on_first_try(self, mock_sleep, mock_get):
         """Should return response on first successful request."""
-        mock_get.return_value = Mock(status_code=200, raise_for_status=Mock())
+        mock_get.return_value = fake_resp()
         
         session = create_session()
         response = get_with_retry("http://example.com", session)
@@ -199,7 +205,7 @@ class TestGetWithRetry(unittest.TestCase):
         
         mock_get.side_effect = [
             RequestException("Network error"),
-            Mock(status_code=200, raise_for_status=Mock())
+            fake_resp()
         ]
         
         session = create_session()
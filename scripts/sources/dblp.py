@@ -8,12 +8,20 @@ Data: XML response with conference metadata
 This replaces direct IEEE/ACM scraping as dblp aggregates both.
 """
 
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import time
 import defusedxml.ElementTree as ET
 from typing import Optional
 
+# pyahocorasick classifies a venue name in one linear scan instead of up to
+# ~25 substring checks; optional, with a pure-Python fallback below
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Import ConfScout HTTP client for proper User-Agent headers
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.http_client import ConfScoutHTTPClient
@@ -31,54 +39,82 @@ SEARCH_TERMS = [
     "ACM conference 2026",
 ]
 
+# Polite pacing for dblp: at most one request per second in aggregate,
+# enforced by the shared client across worker threads
+_MIN_REQUEST_INTERVAL = 1.0
+
+
 def fetch() -> list[dict]:
     """Fetch conferences from dblp.org API."""
     conferences = []
     seen_urls = set()
 
-    for i, term in enumerate(SEARCH_TERMS):
-        if i > 0:
-            time.sleep(1)
-        results = _search_venues(term)
-        for conf in results:
-            if conf["url"] not in seen_urls:
-                seen_urls.add(conf["url"])
-                conferences.append(conf)
+    # One shared client so every search reuses the same keep-alive
+    # connection; a small pool overlaps network latency while the request
+    # pacing keeps the aggregate rate polite
+    client = ConfScoutHTTPClient(min_interval=_MIN_REQUEST_INTERVAL)
+    try:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(_search_venues, term, client=client)
+                for term in SEARCH_TERMS
+            ]
+            # Collect in submission order so duplicate resolution stays
+            # deterministic
+            for future in futures:
+                for conf in future.result():
+                    if conf["url"] not in seen_urls:
+                        seen_urls.add(conf["url"])
+                        conferences.append(conf)
+    finally:
+        client.close()
 
     print(f"[dblp] Fetched {len(conferences)} conferences")
     return conferences
 
 
-def _search_venues(query: str, max_results: int = 50) -> list[dict]:
+def _search_venues(
+    query: str,
+    max_results: int = 50,
+    client: Optional[ConfScoutHTTPClient] = None,
+) -> list[dict]:
     """Search dblp venues API."""
     conferences = []
 
-    # Use ConfScout HTTP client with proper User-Agent as context manager
-    with ConfScoutHTTPClient() as client:
+    # Use the shared client when provided; otherwise create one for
+    # standalone calls
+    own_client = client is None
+    if own_client:
+        client = ConfScoutHTTPClient(min_interval=_MIN_REQUEST_INTERVAL)
+    try:
         try:
             params = {
                 "q": query,
                 "format": "xml",
                 "h": max_results,
             }
-            # Use client session for proper User-Agent header
+            # Use client session for proper User-Agent header; the client
+            # paces requests across worker threads
             response = client.get(DBLP_SEARCH_URL, params=params, timeout=15)
             response.raise_for_status()
 
-            root = ET.fromstring(response.content)
-            hits = root.find("hits")
-            if hits is None:
-                return []
+            # Stream-parse: each <hit> is handled as soon as its end tag
+            # arrives and cleared immediately, so peak memory is one hit
+            # subtree instead of the whole response tree
+            for _, elem in ET.iterparse(io.BytesIO(response.content), events=("end",)):
+                if elem.tag != "hit":
+                    continue
 
-            for hit in hits.findall("hit"):
-                info = hit.find("info")
+                info = elem.find("info")
                 if info is None:
+                    elem.clear()
                     continue
 
                 venue = info.find("venue")
                 url_elem = info.find("url")
 
                 if venue is None or venue.text is None:
+                    elem.clear()
                     continue
 
                 name = venue.text.strip()
@@ -100,30 +136,54 @@ def _search_venues(query: str, max_results: int = 50) -> list[dict]:
                 }
 
                 conferences.append(conference)
+                elem.clear()
 
         except Exception as e:
             print(f"[dblp] Error searching '{query}': {e}")
+    finally:
+        if own_client:
+            client.close()
 
     return conferences
 
 
+# Priority-ordered domain keywords; the first matching domain wins
+_ACADEMIC_DOMAIN_KEYWORDS = (
+    ("ai", ("artificial intelligence", "machine learning", "neural", "deep learning", "nlp", "vision")),
+    ("software", ("software", "engineering", "agile", "devops")),
+    ("security", ("security", "crypto", "privacy", "hacking")),
+    ("data", ("data", "database", "analytics", "big data")),
+    ("web", ("web", "mobile", "frontend", "backend")),
+    ("cloud", ("cloud", "kubernetes", "distributed", "serverless")),
+)
+
+if ahocorasick is not None:
+    _DOMAIN_AUTOMATON = ahocorasick.Automaton()
+    for _domain, _keywords in _ACADEMIC_DOMAIN_KEYWORDS:
+        for _kw in _keywords:
+            _DOMAIN_AUTOMATON.add_word(_kw, _domain)
+    _DOMAIN_AUTOMATON.make_automaton()
+else:
+    _DOMAIN_AUTOMATON = None
+
+
 def _classify_academic_domain(name: str) -> str:
     """Classify academic conference by domain."""
     name_lower = name.lower()
-    
-    if any(kw in name_lower for kw in ["artificial intelligence", "machine learning", "neural", "deep learning", "nlp", "vision"]):
-        return "ai"
-    if any(kw in name_lower for kw in ["software", "engineering", "agile", "devops"]):
-        return "software"
-    if any(kw in name_lower for kw in ["security", "crypto", "privacy", "hacking"]):
-        return "security"
-    if any(kw in name_lower for kw in ["data", "database", "analytics", "big data"]):
-        return "data"
-    if any(kw in name_lower for kw in ["web", "mobile", "frontend", "backend"]):
-        return "web"
-    if any(kw in name_lower for kw in ["cloud", "kubernetes", "distributed", "serverless"]):
-        return "cloud"
-    
+
+    if _DOMAIN_AUTOMATON is not None:
+        # One scan collects every matching domain; the priority order of
+        # _ACADEMIC_DOMAIN_KEYWORDS then decides the winner
+        matched = {domain for _, domain in _DOMAIN_AUTOMATON.iter(name_lower)}
+        for domain, _ in _ACADEMIC_DOMAIN_KEYWORDS:
+            if domain in matched:
+                return domain
+        return "academic"
+
+    for domain, keywords in _ACADEMIC_DOMAIN_KEYWORDS:
+        if any(kw in name_lower for kw in keywords):
+            return domain
+
     return "academic"
 
 
@@ -5,9 +5,16 @@ URL: https://github.com/tech-conferences/conference-data
 Structure: /conferences/{year}/{topic}.json (e.g., javascript.json, python.json)
 """
 
-import requests
+import json
+import sys
+from pathlib import Path
 from typing import List, Dict, Optional
 
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.http_client import get_cached
+
 # Base URL for raw GitHub content
 GITHUB_BASE = "https://raw.githubusercontent.com/tech-conferences/conference-data/main/conferences"
 GITHUB_API = "https://api.github.com/repos/tech-conferences/conference-data/contents/conferences"
@@ -82,9 +89,9 @@ def fetch() -> List[Dict]:
                 if not data_url:
                     data_url = f"{GITHUB_BASE}/{year}/{file_info['name']}"
                 
-                data_resp = requests.get(data_url, timeout=10)
-                data_resp.raise_for_status()
-                items = data_resp.json()
+                # Topic files change rarely; a conditional GET reuses the
+                # cached body on 304 Not Modified
+                items = json.loads(get_cached(data_url, timeout=10))
             except Exception as e:
                 print(f"[tech_conferences] Error fetching {year}/{topic}: {e}")
                 continue
@@ -5,9 +5,42 @@ Smart merging of conferences from multiple sources.
 """
 
 import re
+import string
+from datetime import date
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Optional
 
+# rapidfuzz computes similarity in C++, 10-100x faster than the pure-Python
+# SequenceMatcher that otherwise dominates the pairwise duplicate checks;
+# process.extract additionally runs the whole candidate scan for one name
+# in a single C call instead of a Python-level inner loop
+try:
+    from rapidfuzz import fuzz, process as _rf_process
+except ImportError:
+    fuzz = None
+    _rf_process = None
+
+# datasketch's MinHash LSH buckets near-identical names together in O(N),
+# so pairwise fuzzy checks only run on actual candidate pairs and a
+# leading "The " or year prefix no longer splits duplicates into
+# different buckets; optional, with prefix grouping as the fallback
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = None
+    MinHashLSH = None
+
+_LSH_NUM_PERM = 64
+
+# _normalize_name runs for every conference during grouping and again for
+# every pairwise comparison inside a group. ASCII punctuation is deleted
+# with one C-level str.translate pass; the compiled regex only runs for
+# names containing non-ASCII characters the table cannot cover.
+_NORM_KEEP = frozenset(string.ascii_lowercase + string.digits + string.whitespace)
+_NORM_TABLE = str.maketrans({c: None for c in map(chr, range(128)) if c not in _NORM_KEEP})
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+
 
 # Source priority (higher = preferred)
 SOURCE_PRIORITY = {
@@ -21,6 +54,22 @@ SOURCE_PRIORITY = {
 }
 
 
+class _UnionFind:
+    """Disjoint-set over group indices with path compression."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        self.parent[self.find(i)] = self.find(j)
+
+
 def deduplicate(conferences: list[dict]) -> list[dict]:
     """
     Merge duplicate conferences.
@@ -32,118 +81,233 @@ def deduplicate(conferences: list[dict]) -> list[dict]:
     """
     if not conferences:
         return []
-    
-    # Group by normalized name prefix
+
+    # The full normalized name is stashed on each dict so candidate
+    # generation and pairwise checks don't re-normalize both sides of
+    # every comparison; it is stripped from the results below.
+    for conf in conferences:
+        conf["_norm_name"] = _normalize_name(conf.get("name", ""))
+
+    if MinHashLSH is not None and len(conferences) > 1:
+        result = _deduplicate_lsh(conferences)
+    else:
+        result = _deduplicate_grouped(conferences)
+
+    # Strip the working key from the inputs and the merged copies
+    for conf in conferences:
+        conf.pop("_norm_name", None)
+    for conf in result:
+        conf.pop("_norm_name", None)
+
+    return result
+
+
+def _name_minhash(name: str):
+    """MinHash over character 3-grams of a normalized name."""
+    minhash = MinHash(num_perm=_LSH_NUM_PERM)
+    for i in range(len(name) - 2):
+        minhash.update(name[i:i + 3].encode("utf-8"))
+    return minhash
+
+
+def _deduplicate_lsh(conferences: list[dict]) -> list[dict]:
+    """
+    Dedup with an LSH prefilter: names land in shared LSH buckets when
+    their 3-gram sets are ~70% similar, so only those candidate pairs
+    reach the fuzzy check. Transitive matches merge via union-find.
+    """
+    lsh = MinHashLSH(threshold=0.7, num_perm=_LSH_NUM_PERM)
+    hashes = []
+    for idx, conf in enumerate(conferences):
+        minhash = _name_minhash(conf["_norm_name"])
+        hashes.append(minhash)
+        lsh.insert(str(idx), minhash)
+
+    dsu = _UnionFind(len(conferences))
+    for i, minhash in enumerate(hashes):
+        for key in lsh.query(minhash):
+            j = int(key)
+            if j <= i or dsu.find(i) == dsu.find(j):
+                continue
+            if _is_duplicate(conferences[i], conferences[j]):
+                dsu.union(i, j)
+
+    components: dict[int, list[dict]] = {}
+    for idx, conf in enumerate(conferences):
+        components.setdefault(dsu.find(idx), []).append(conf)
+
+    result = []
+    for comp in components.values():
+        comp.sort(key=lambda c: SOURCE_PRIORITY.get(c.get("source", ""), 0), reverse=True)
+        result.append(_merge_conferences(comp))
+    return result
+
+
+def _deduplicate_grouped(conferences: list[dict]) -> list[dict]:
+    """Fallback dedup: bucket by 20-char normalized-name prefix."""
     groups: dict[str, list[dict]] = {}
-    
+
     for conf in conferences:
-        key = _normalize_name(conf.get("name", ""))[:20]  # First 20 chars
+        key = conf["_norm_name"][:20]  # First 20 chars
         if key not in groups:
             groups[key] = []
         groups[key].append(conf)
-    
+
     result = []
-    
+
     for key, group in groups.items():
         if len(group) == 1:
             result.append(group[0])
             continue
-        
+
         # Sort by source priority
         group.sort(key=lambda c: SOURCE_PRIORITY.get(c.get("source", ""), 0), reverse=True)
-        
-        merged = []
-        used = set()
-        
-        for i, conf in enumerate(group):
-            if i in used:
-                continue
-            
-            # Find duplicates
-            duplicates = [conf]
-            for j, other in enumerate(group[i+1:], start=i+1):
-                if j in used:
-                    continue
-                if _is_duplicate(conf, other):
-                    duplicates.append(other)
-                    used.add(j)
-            
-            # Merge duplicates into the highest priority one
-            merged_conf = _merge_conferences(duplicates)
-            merged.append(merged_conf)
-        
-        result.extend(merged)
-    
+
+        # Union-find over matched pairs: members already in the same
+        # component skip the similarity check, and transitive duplicates
+        # (a~b, b~c) land in one component even when a and c alone would
+        # not match
+        dsu = _UnionFind(len(group))
+        if _rf_process is not None:
+            # The name-similarity scan for each member against the rest of
+            # the group runs as one C call; only the (rare) hits come back
+            # to Python for the date check
+            names = [c["_norm_name"] for c in group]
+            for i in range(len(group) - 1):
+                matches = _rf_process.extract(
+                    names[i], names[i + 1:],
+                    scorer=fuzz.ratio, score_cutoff=75, limit=None,
+                )
+                for _, _, offset in matches:
+                    j = i + 1 + offset
+                    if dsu.find(i) == dsu.find(j):
+                        continue
+                    if names[i] and _dates_compatible(group[i], group[j]):
+                        dsu.union(i, j)
+        else:
+            for i in range(len(group)):
+                for j in range(i + 1, len(group)):
+                    if dsu.find(i) == dsu.find(j):
+                        continue
+                    if _is_duplicate(group[i], group[j]):
+                        dsu.union(i, j)
+
+        components: dict[int, list[dict]] = {}
+        for idx, conf in enumerate(group):
+            components.setdefault(dsu.find(idx), []).append(conf)
+
+        result.extend(_merge_conferences(comp) for comp in components.values())
+
     return result
 
 
+@lru_cache(maxsize=8192)
 def _normalize_name(name: str) -> str:
-    """Normalize conference name for comparison."""
+    """Normalize conference name for comparison. Memoized: the same name
+    is normalized several times across grouping and duplicate checks."""
     if not name:
         return ""
     # Lowercase, remove special chars, collapse whitespace
-    name = name.lower()
-    name = re.sub(r"[^a-z0-9\s]", "", name)
-    name = re.sub(r"\s+", " ", name).strip()
-    return name
+    name = name.lower().translate(_NORM_TABLE)
+    if not name.isascii():
+        name = _NON_ALNUM_RE.sub("", name)
+    return " ".join(name.split())
 
 
 def _is_duplicate(conf1: dict, conf2: dict) -> bool:
     """Check if two conferences are duplicates."""
-    name1 = _normalize_name(conf1.get("name", ""))
-    name2 = _normalize_name(conf2.get("name", ""))
+    # Prefer the normalization stashed by deduplicate; fall back for
+    # standalone calls
+    name1 = conf1.get("_norm_name")
+    if name1 is None:
+        name1 = _normalize_name(conf1.get("name", ""))
+    name2 = conf2.get("_norm_name")
+    if name2 is None:
+        name2 = _normalize_name(conf2.get("name", ""))
     
-    # Name similarity check
-    similarity = SequenceMatcher(None, name1, name2).ratio()
+    # Length filter: the ratio can never exceed 2*min/(sum), so skip the
+    # expensive matcher when even a perfect overlap misses the threshold
+    l1, l2 = len(name1), len(name2)
+    if l1 == 0 or l2 == 0:
+        return False
+    if 2 * min(l1, l2) / (l1 + l2) < 0.75:
+        return False
+
+    # Name similarity check (score_cutoff lets rapidfuzz bail out early)
+    if fuzz is not None:
+        similarity = fuzz.ratio(name1, name2, score_cutoff=75) / 100.0
+    else:
+        similarity = SequenceMatcher(None, name1, name2).ratio()
     if similarity < 0.75:
         return False
-    
-    # Date check (if available)
+
+    return _dates_compatible(conf1, conf2)
+
+
+def _dates_compatible(conf1: dict, conf2: dict) -> bool:
+    """Start dates (when both known) must be within a week of each other."""
     date1 = conf1.get("startDate")
     date2 = conf2.get("startDate")
     if date1 and date2:
         if abs(_date_diff(date1, date2)) > 7:  # More than 7 days apart
             return False
-    
     return True
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, memoized: the same few start dates
+    recur across the O(pairs) date checks."""
+    try:
+        return date.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def _date_diff(date1: str, date2: str) -> int:
     """Calculate difference in days between two date strings."""
-    from datetime import datetime
-    try:
-        d1 = datetime.strptime(date1, "%Y-%m-%d")
-        d2 = datetime.strptime(date2, "%Y-%m-%d")
-        return abs((d1 - d2).days)
-    except:
+    d1 = _parse_iso_date(date1)
+    d2 = _parse_iso_date(date2)
+    if d1 is None or d2 is None:
         return 0
+    return abs((d1 - d2).days)
+
+
+# Top-level fields backfilled from lower-priority duplicates during a merge
+_MERGE_FIELDS = ("startDate", "endDate", "cfp", "twitter")
 
 
 def _merge_conferences(duplicates: list[dict]) -> dict:
-    """Merge multiple duplicate conferences into one."""
+    """
+    Merge multiple duplicate conferences into one.
+
+    Callers pass the list already sorted by source priority: the first
+    entry wins and the rest backfill its missing fields in one pass.
+    """
     if len(duplicates) == 1:
         return duplicates[0]
-    
-    # Start with highest priority
-    duplicates.sort(key=lambda c: SOURCE_PRIORITY.get(c.get("source", ""), 0), reverse=True)
+
     base = duplicates[0].copy()
-    
-    # Fill in missing fields from other sources
+    sources = set()
+    if base.get("source"):
+        sources.add(base["source"])
+
     for dup in duplicates[1:]:
-        if not base.get("startDate") and dup.get("startDate"):
-            base["startDate"] = dup["startDate"]
-        if not base.get("endDate") and dup.get("endDate"):
-            base["endDate"] = dup["endDate"]
-        if not base.get("cfp") and dup.get("cfp"):
-            base["cfp"] = dup["cfp"]
-        if not base.get("location", {}).get("country") and dup.get("location", {}).get("country"):
-            base["location"]["country"] = dup["location"]["country"]
-        if not base.get("twitter") and dup.get("twitter"):
-            base["twitter"] = dup["twitter"]
-    
+        for field in _MERGE_FIELDS:
+            if not base.get(field):
+                value = dup.get(field)
+                if value:
+                    base[field] = value
+        if not base.get("location", {}).get("country"):
+            country = dup.get("location", {}).get("country")
+            if country:
+                base["location"]["country"] = country
+        if dup.get("source"):
+            sources.add(dup["source"])
+
     # Track merged sources
-    base["sources"] = list(set(d.get("source", "") for d in duplicates if d.get("source")))
-    
+    base["sources"] = list(sources)
+
     return base
 
 
@@ -5,6 +5,7 @@ Classifies conferences into domains and sub-domains.
 """
 
 import re
+from functools import lru_cache
 
 
 DOMAIN_KEYWORDS = {
@@ -54,35 +55,46 @@ DOMAIN_KEYWORDS = {
 def classify(name: str, tags: list[str] = None) -> tuple[str, list[str]]:
     """
     Classify a conference by domain and sub-domains.
-    
+
     Returns:
         (primary_domain, list_of_sub_domains)
     """
-    text = (name + " " + " ".join(tags or [])).lower()
-    
+    text = (name + " " + " ".join(tags or [])).strip().lower()
+    primary, sub_domains = _classify_text(text)
+    return primary, list(sub_domains)
+
+
+@lru_cache(maxsize=8192)
+def _classify_text(text: str) -> tuple[str, tuple[str, ...]]:
+    """Classify normalized text. Cached: recurring series names hit often."""
     matches = []
-    
+
     for domain, keywords in DOMAIN_KEYWORDS.items():
         score = sum(1 for kw in keywords if kw in text)
         if score > 0:
             matches.append((domain, score))
-    
+
     if not matches:
-        return "general", []
-    
+        return "general", ()
+
     # Sort by score, primary is highest
     matches.sort(key=lambda x: x[1], reverse=True)
-    
+
     primary = matches[0][0]
-    sub_domains = [m[0] for m in matches[1:4]]  # Up to 3 sub-domains
-    
+    sub_domains = tuple(m[0] for m in matches[1:4])  # Up to 3 sub-domains
+
     return primary, sub_domains
 
 
 def extract_tags(name: str, description: str = "") -> list[str]:
     """Extract technology tags from conference name/description."""
-    text = f"{name} {description}".lower()
-    
+    return list(_extract_tags_text(f"{name} {description}".strip().lower()))
+
+
+@lru_cache(maxsize=8192)
+def _extract_tags_text(text: str) -> tuple[str, ...]:
+    """Extract tags from normalized text. Cached on the full text."""
+
     TECH_TAGS = [
         "python", "javascript", "typescript", "java", "kotlin", "swift",
         "rust", "go", "golang", "ruby", "php", "scala", "elixir",
@@ -99,8 +111,8 @@ def extract_tags(name: str, description: str = "") -> list[str]:
         # Word boundary match
         if re.search(rf"\b{re.escape(tag)}\b", text):
             found.append(tag)
-    
-    return found[:5]  # Max 5 tags
+
+    return tuple(found[:5])  # Max 5 tags
 
 
 if __name__ == "__main__":
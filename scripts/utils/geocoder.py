@@ -7,16 +7,29 @@ Enhanced with rate limiting and retry logic for external API calls.
 """
 
 from typing import Optional, Tuple
+import atexit
 import json
+import sqlite3
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 import requests
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+import threading
 import time
 import asyncio
 from .rate_limiter import rate_limit
 from .retry import retry_sync
 
+# pyahocorasick finds every known city/country embedded in a location
+# string in one linear scan; optional, with substring-loop fallbacks below
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Static city coordinates (expand as needed)
 CITY_COORDS = {
     # Europe
@@ -123,10 +136,40 @@ COUNTRY_COORDS = {
 }
 
 
+# Partial-match iteration order: longest keys first, so "new delhi" wins
+# over "delhi" when both are embedded in the input. Keys are interned
+# since the same city strings recur across lookups in one run.
+_CITY_ITEMS = sorted(
+    ((sys.intern(k), v) for k, v in CITY_COORDS.items()), key=lambda kv: -len(kv[0])
+)
+_COUNTRY_ITEMS = sorted(
+    ((sys.intern(k), v) for k, v in COUNTRY_COORDS.items()), key=lambda kv: -len(kv[0])
+)
+
+
+def _build_automaton(keys) -> Optional[object]:
+    """Compile dict keys into an Aho-Corasick automaton (None if absent)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for key in keys:
+        automaton.add_word(key, key)
+    automaton.make_automaton()
+    return automaton
+
+
+_CITY_AUTOMATON = _build_automaton(CITY_COORDS)
+_COUNTRY_AUTOMATON = _build_automaton(COUNTRY_COORDS)
+
+
+@lru_cache(maxsize=None)
 def geocode(city: str, country: str) -> Optional[Tuple[float, float]]:
     """
     Get lat/lng coordinates for a location.
-    
+
+    Memoized: many conferences share the same (city, country) pair, so each
+    unique pair pays the lookup cost once per run.
+
     Returns:
         (lat, lng) tuple or None if not found
     """
@@ -138,19 +181,40 @@ def geocode(city: str, country: str) -> Optional[Tuple[float, float]]:
         return CITY_COORDS[city_lower]
     
     # Try partial city match
-    for known_city, coords in CITY_COORDS.items():
-        if known_city in city_lower or city_lower in known_city:
-            return coords
-    
+    if _CITY_AUTOMATON is not None:
+        # One linear scan finds every known city embedded in the input;
+        # the longest embedded city wins ties
+        matched = {found for _, found in _CITY_AUTOMATON.iter(city_lower)}
+        if matched:
+            for known_city, coords in _CITY_ITEMS:
+                if known_city in matched:
+                    return coords
+        # Reverse direction: the input is a fragment of a known city
+        # (e.g. "francisco"); empty input deliberately matches nothing
+        if city_lower:
+            for known_city, coords in _CITY_ITEMS:
+                if city_lower in known_city:
+                    return coords
+    else:
+        for known_city, coords in _CITY_ITEMS:
+            if known_city in city_lower or city_lower in known_city:
+                return coords
+
     # Fall back to country
     if country_lower in COUNTRY_COORDS:
         return COUNTRY_COORDS[country_lower]
-    
+
     # Try partial country match
-    for known_country, coords in COUNTRY_COORDS.items():
-        if known_country in country_lower:
-            return coords
-    
+    if _COUNTRY_AUTOMATON is not None:
+        matched = {found for _, found in _COUNTRY_AUTOMATON.iter(country_lower)}
+        for known_country, coords in _COUNTRY_ITEMS:
+            if known_country in matched:
+                return coords
+    else:
+        for known_country, coords in _COUNTRY_ITEMS:
+            if known_country in country_lower:
+                return coords
+
     return None
 
 
@@ -191,95 +255,408 @@ def geocode_with_nominatim(city: str, country: str) -> Optional[Tuple[float, flo
         raise
 
 
+class NominatimLimiter:
+    """
+    Async gate enforcing Nominatim's 1 request/second limit.
+
+    Concurrent lookups queue on an asyncio.Lock and each start is spaced
+    one interval after the previous one, so the aggregate rate stays
+    polite while DNS, TLS, and server work overlap across requests.
+    """
+
+    def __init__(self, min_interval: float = 1.0):
+        self._min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_time = 0.0
+
+    async def __aenter__(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_time - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_time = loop.time() + self._min_interval
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+_nominatim_limiter = NominatimLimiter()
+
+
+def _nominatim_query(city: str, country: str) -> Optional[Tuple[float, float]]:
+    """Blocking Nominatim lookup without pacing (callers handle limits)."""
+    geolocator = Nominatim(user_agent="conf_scout_geocoder_v2")
+    location = geolocator.geocode(f"{city}, {country}")
+    if location:
+        return (location.latitude, location.longitude)
+    return None
+
+
+async def geocode_with_nominatim_async(city: str, country: str) -> Optional[Tuple[float, float]]:
+    """
+    Async Nominatim lookup paced by the shared limiter.
+
+    The limiter only spaces request starts, so concurrent lookups overlap
+    their network round trips instead of sleeping serially.
+
+    Returns:
+        (lat, lng) tuple or None if not found
+    """
+    if not city or not country:
+        return None
+
+    async with _nominatim_limiter:
+        pass  # gate the start; the lookup itself runs concurrently
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, _nominatim_query, city, country)
+    except (GeocoderTimedOut, GeocoderServiceError) as e:
+        print(f"[GEO] API error for {city}, {country}: {str(e)}")
+        return None
+
+
 class GeocodeCache:
-    """Persistent cache for geocoding results"""
-    
+    """
+    Persistent cache for geocoding results, backed by SQLite.
+
+    city_cache.sqlite holds one key/value row per (city, country) pair.
+    WAL mode makes each insert an O(log N) page write instead of the old
+    rewrite-the-whole-JSON-file pattern, and startup no longer loads the
+    full cache into memory; keys touched during a run are kept in a small
+    in-process dict so repeated lookups skip the database entirely.
+
+    A legacy city_cache.json snapshot (plus its .log sidecar, if present)
+    is migrated into the database the first time it is created.
+    """
+
     def __init__(self, cache_file: str = "scripts/city_cache.json"):
         self.cache_file = Path(cache_file)
-        self.cache = self._load_cache()
-    
-    def _load_cache(self) -> dict:
-        """Load cache from file"""
+        self.db_file = self.cache_file.with_suffix(".sqlite")
+        migrate = not self.db_file.exists()
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared across worker threads; _db_lock serializes
+        # statements since sqlite3 objects are not thread-safe themselves
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocache(key TEXT PRIMARY KEY, lat REAL, lng REAL)"
+        )
+        self._conn.commit()
+        self._db_lock = threading.Lock()
+        self._hot: dict = {}
+        self._defer_saves = False
+        self._dirty = False
+        if migrate:
+            self._migrate_legacy_json()
+        atexit.register(self.close)
+
+    @staticmethod
+    def _coerce_legacy_coords(value) -> Optional[list]:
+        """Normalize a legacy cache value to [lat, lng], or None to skip.
+
+        The JSON file accumulated two shapes over time: this module's
+        [lat, lng] lists, and fetch_confs.py's {"lat": ..., "lng": ...,
+        "ts": ...} dicts plus {"miss": true, ...} negative sentinels.
+        Miss sentinels and anything malformed are dropped rather than
+        migrated as garbage coordinates."""
+        if isinstance(value, dict):
+            lat, lng = value.get("lat"), value.get("lng")
+            if isinstance(lat, (int, float)) and isinstance(lng, (int, float)):
+                return [lat, lng]
+            return None
+        if (
+            isinstance(value, (list, tuple))
+            and len(value) == 2
+            and all(isinstance(v, (int, float)) for v in value)
+        ):
+            return list(value)
+        return None
+
+    def _migrate_legacy_json(self) -> None:
+        """One-time import of the old JSON snapshot and append-only log"""
+        entries = {}
         if self.cache_file.exists():
             try:
                 with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    for key, value in json.load(f).items():
+                        coords = self._coerce_legacy_coords(value)
+                        if coords is not None:
+                            entries[key] = coords
             except (json.JSONDecodeError, IOError) as e:
-                print(f"[CACHE] Failed to load cache: {e}")
-                return {}
-        return {}
-    
-    def _save_cache(self) -> bool:
-        """Save cache to file"""
-        try:
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-            return True
-        except IOError as e:
-            print(f"[CACHE] Failed to save cache: {e}")
-            return False
-    
+                print(f"[CACHE] Failed to migrate legacy cache: {e}")
+        log_file = self.cache_file.with_suffix(".log")
+        if log_file.exists():
+            try:
+                with open(log_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            entry = json.loads(line)
+                            coords = self._coerce_legacy_coords(entry["v"])
+                            if coords is not None:
+                                entries[entry["k"]] = coords
+                        except (json.JSONDecodeError, KeyError):
+                            # Torn write from a crashed run; skip it
+                            continue
+            except IOError as e:
+                print(f"[CACHE] Failed to migrate legacy cache log: {e}")
+        if entries:
+            self.set_many(entries.items())
+            print(f"[CACHE] Migrated {len(entries)} legacy cache entries to SQLite")
+
     def get(self, key: str) -> Optional[Tuple[float, float]]:
         """Get coordinates from cache"""
-        return self.cache.get(key)
-    
+        coords = self._hot.get(key)
+        if coords is not None:
+            return coords
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT lat, lng FROM geocache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        coords = [row[0], row[1]]
+        self._hot[key] = coords
+        return coords
+
     def set(self, key: str, coords: Tuple[float, float]) -> bool:
         """Store coordinates in cache"""
-        self.cache[key] = list(coords)
-        return self._save_cache()
-    
+        coords = list(coords)
+        self._hot[key] = coords
+        try:
+            with self._db_lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO geocache(key, lat, lng) VALUES (?, ?, ?)",
+                    (key, coords[0], coords[1]),
+                )
+                if self._defer_saves:
+                    self._dirty = True
+                else:
+                    self._conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"[CACHE] Failed to save cache entry: {e}")
+            return False
+
+    def set_many(self, pairs) -> bool:
+        """Store many (key, coords) entries in a single transaction"""
+        rows = []
+        for key, coords in pairs:
+            coords = list(coords)
+            self._hot[key] = coords
+            rows.append((key, coords[0], coords[1]))
+        try:
+            with self._db_lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO geocache(key, lat, lng) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"[CACHE] Failed to save cache entries: {e}")
+            return False
+
+    @contextmanager
+    def batch(self):
+        """Group writes into one transaction committed when the block exits"""
+        self._defer_saves = True
+        try:
+            yield self
+        finally:
+            self._defer_saves = False
+            if self._dirty:
+                self._dirty = False
+                with self._db_lock:
+                    self._conn.commit()
+
     def has(self, key: str) -> bool:
         """Check if key exists in cache"""
-        return key in self.cache
+        return self.get(key) is not None
+
+    def close(self) -> None:
+        """Commit pending writes and close the database"""
+        try:
+            with self._db_lock:
+                self._conn.commit()
+                self._conn.close()
+        except sqlite3.Error:
+            pass
 
 
 # Global cache instance
 _geocode_cache = GeocodeCache()
 
+# In-flight request coalescing: the same (city, country) pair appears many
+# times per feed, and concurrent lookups can all race past the cache check
+# before the first one writes its result. Duplicates wait on the first
+# caller instead of re-hitting the API.
+_inflight_lock = threading.Lock()
+_inflight_sync: dict = {}
+_inflight_async: dict = {}
+
 
+@lru_cache(maxsize=10000)
 def geocode_with_cache(city: str, country: str, use_api: bool = True) -> Optional[Tuple[float, float]]:
     """
     Get coordinates with caching and optional API fallback.
-    
+
+    Memoized per (city, country, use_api): repeat callers within one run
+    skip key normalization and the persistent-cache lookup entirely.
+
     Args:
         city: City name
         country: Country name
         use_api: Whether to use Nominatim API as fallback
-        
+
     Returns:
         (lat, lng) tuple or None if not found
     """
+    return _geocode_with_cache_impl(city, country, use_api)
+
+
+def _geocode_with_cache_impl(city: str, country: str, use_api: bool) -> Optional[Tuple[float, float]]:
     if not city or not country:
         return None
     
     # Create cache key
     cache_key = f"{city.lower().strip()},{country.lower().strip()}"
-    
+
     # Check cache first
     cached = _geocode_cache.get(cache_key)
     if cached:
         return tuple(cached)
-    
-    # Try static database
-    static_result = geocode(city, country)
-    if static_result:
-        _geocode_cache.set(cache_key, static_result)
-        return static_result
-    
-    # Fall back to API if enabled
-    if use_api:
-        try:
-            api_result = geocode_with_nominatim(city, country)
+
+    # Coalesce concurrent lookups of the same key: the first caller does
+    # the work, later callers wait and read its cached result
+    while True:
+        with _inflight_lock:
+            pending = _inflight_sync.get(cache_key)
+            if pending is None:
+                done = threading.Event()
+                _inflight_sync[cache_key] = done
+                break
+        pending.wait()
+        cached = _geocode_cache.get(cache_key)
+        if cached:
+            return tuple(cached)
+        # The worker failed without caching; loop and try becoming the worker
+
+    try:
+        # Try static database
+        static_result = geocode(city, country)
+        if static_result:
+            _geocode_cache.set(cache_key, static_result)
+            return static_result
+
+        # Fall back to API if enabled
+        if use_api:
+            try:
+                api_result = geocode_with_nominatim(city, country)
+                if api_result:
+                    _geocode_cache.set(cache_key, api_result)
+                    return api_result
+            except Exception as e:
+                print(f"[GEO] API fallback failed for {city}, {country}: {str(e)}")
+
+        # Cache miss as well to avoid repeated API calls
+        _geocode_cache.set(cache_key, (0, 0))
+        return None
+    finally:
+        with _inflight_lock:
+            _inflight_sync.pop(cache_key, None)
+        done.set()
+
+
+async def geocode_with_cache_async(city: str, country: str, use_api: bool = True) -> Optional[Tuple[float, float]]:
+    """
+    Async variant of geocode_with_cache for concurrent batch lookups.
+
+    Cache and static-database hits resolve without touching the event
+    loop; only API fallbacks await the shared Nominatim limiter.
+
+    Returns:
+        (lat, lng) tuple or None if not found
+    """
+    if not city or not country:
+        return None
+
+    cache_key = f"{city.lower().strip()},{country.lower().strip()}"
+
+    cached = _geocode_cache.get(cache_key)
+    if cached:
+        return tuple(cached)
+
+    # Coalesce duplicate concurrent lookups onto one future
+    existing = _inflight_async.get(cache_key)
+    if existing is not None:
+        return await existing
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight_async[cache_key] = future
+
+    try:
+        result = None
+        static_result = geocode(city, country)
+        if static_result:
+            _geocode_cache.set(cache_key, static_result)
+            result = static_result
+        elif use_api:
+            api_result = await geocode_with_nominatim_async(city, country)
             if api_result:
                 _geocode_cache.set(cache_key, api_result)
-                return api_result
-        except Exception as e:
-            print(f"[GEO] API fallback failed for {city}, {country}: {str(e)}")
-    
-    # Cache miss as well to avoid repeated API calls
-    _geocode_cache.set(cache_key, (0, 0))
-    return None
+                result = api_result
+
+        if result is None:
+            # Cache miss as well to avoid repeated API calls
+            _geocode_cache.set(cache_key, (0, 0))
+
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        if not future.done():
+            future.set_exception(e)
+        raise
+    finally:
+        _inflight_async.pop(cache_key, None)
+
+
+async def geocode_many_async(pairs: list, use_api: bool = True) -> list:
+    """
+    Geocode many (city, country) pairs concurrently.
+
+    API lookups stay at 1 request/second in aggregate via the shared
+    limiter, but their round trips overlap; the cache file is written
+    once at the end.
+
+    Returns:
+        List of (lat, lng) tuples or None, in the same order as pairs
+    """
+    with _geocode_cache.batch():
+        return list(await asyncio.gather(
+            *(geocode_with_cache_async(city, country, use_api) for city, country in pairs)
+        ))
+
+
+def geocode_batch(pairs: list, use_api: bool = True) -> list:
+    """
+    Geocode many (city, country) pairs with a single cache file write.
+
+    Args:
+        pairs: List of (city, country) tuples
+        use_api: Whether to use Nominatim API as fallback
+
+    Returns:
+        List of (lat, lng) tuples or None, in the same order as pairs
+    """
+    with _geocode_cache.batch():
+        return [geocode_with_cache(city, country, use_api) for city, country in pairs]
 
 
 if __name__ == "__main__":
@@ -5,8 +5,57 @@ Centralized HTTP client configuration with proper User-Agent headers
 to avoid being blocked/flagged by external services.
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
 import requests
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from typing import Dict, List, Optional
+from urllib3.util.retry import Retry
+
+from .rate_limiter import SyncTokenBucket
+
+logger = logging.getLogger(__name__)
+
+# urllib3 2.x adds backoff_jitter/backoff_max constructor args; probe once
+# so the Retry policy works on either major version
+try:
+    Retry(backoff_jitter=0.0, backoff_max=1.0)
+    _RETRY_V2_ARGS = True
+except TypeError:
+    _RETRY_V2_ARGS = False
+
+# httpx enables HTTP/2 multiplexing (many requests over one connection);
+# fall back to requests + threads if it is not installed
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# urllib3 advertises exactly the codings it can decode (br when a brotli
+# backend is importable, zstd when zstandard is); derive our header from
+# that set so we never request bytes we cannot decompress. Preference
+# order puts the denser codings first - zstd/br shave 15-30% off JSON
+# and HTML payloads compared to gzip.
+try:
+    from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_ACCEPT_ENCODING
+except ImportError:
+    _URLLIB3_ACCEPT_ENCODING = "gzip,deflate"
+
+_DECODABLE_ENCODINGS = {token.strip() for token in _URLLIB3_ACCEPT_ENCODING.split(",")}
+ACCEPT_ENCODING = ", ".join(
+    encoding for encoding in ("zstd", "br", "gzip", "deflate")
+    if encoding in _DECODABLE_ENCODINGS
+)
 
 # Standard User-Agent for ConfScout scrapers
 # Format: Mozilla/5.0 (compatible; BotName/Version; +ContactURL)
@@ -24,42 +73,320 @@ NOMINATIM_USER_AGENT = "ConfScout-Conference-Finder/2.0"
 # GitHub API User-Agent (best practice for GitHub API)
 GITHUB_USER_AGENT = "ConfScout-Data-Fetcher/2.0"
 
+# Connection pool sizing for sessions. Sized for all source fetchers hitting
+# the same host concurrently so repeated GETs reuse TCP/TLS connections.
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Upper bound on a single retry sleep so capped exponential backoff never
+# stalls a fetcher for minutes
+RETRY_BACKOFF_CAP = 30.0
+
+# On-disk cache for conditional GETs (ETag / Last-Modified validation)
+HTTP_CACHE_DIR = Path(__file__).parent.parent / "http_cache"
+
+
+def _build_retry(max_retries: int = 3, backoff_factor: float = 1.0) -> Retry:
+    """
+    Retry policy applied inside the connection pool.
+
+    Retriable statuses (429 and transient 5xx) back off and retry within
+    urllib3 itself, honoring Retry-After and reusing the open connection
+    across attempts instead of paying DNS/TLS again. Connect/read
+    failures are excluded (connect=0, read=0): those surface as
+    exceptions for get_with_retry's own ladder, so the two retry layers
+    split transport vs status errors instead of stacking.
+    """
+    kwargs = dict(
+        total=max_retries,
+        connect=0,
+        read=0,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+    )
+    if _RETRY_V2_ARGS:
+        kwargs["backoff_jitter"] = backoff_factor
+        kwargs["backoff_max"] = RETRY_BACKOFF_CAP
+    return Retry(**kwargs)
+
+
+def _mount_pooled_adapters(session: requests.Session, pool_maxsize: int = POOL_MAXSIZE) -> None:
+    """
+    Mount HTTP adapters with a tuned pool and in-pool retries.
+
+    pool_maxsize must cover the caller's fan-out: an undersized per-host
+    pool makes concurrent workers discard connections on check-in and
+    pay a fresh TCP/TLS handshake per request. pool_block stays False so
+    bursts above the limit degrade to extra connections, not deadlock.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        pool_block=False,
+        max_retries=_build_retry(),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+# Baked once at import: every session shares the same immutable template
+# instead of rebuilding the literal per call
+_BASE_HEADERS = MappingProxyType({
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Connection": "keep-alive",
+})
+
+
+def _default_headers(
+    user_agent: str,
+    additional_headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """Build the standard ConfScout header set for a session."""
+    headers = {**_BASE_HEADERS, "User-Agent": user_agent}
+    if additional_headers:
+        headers.update(additional_headers)
+    return headers
+
+
+# Headers that must not be carried onto an httpx client: Connection is
+# hop-by-hop and forbidden in HTTP/2 messages (RFC 9113), and our
+# Accept-Encoding reflects urllib3's decoder set, which need not match
+# what httpx can decompress - httpx advertises its own.
+_HTTPX_SKIP_HEADERS = frozenset({"connection", "accept-encoding"})
+
+
+def _httpx_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Filter a requests-style header set for use on an httpx client."""
+    return {k: v for k, v in headers.items() if k.lower() not in _HTTPX_SKIP_HEADERS}
+
 
 def create_session(
     user_agent: str = DEFAULT_USER_AGENT,
-    additional_headers: Optional[Dict[str, str]] = None
-) -> requests.Session:
+    additional_headers: Optional[Dict[str, str]] = None,
+    http_backend: str = "requests",
+):
     """
-    Create a configured requests session with proper headers.
-    
+    Create a configured HTTP session with proper headers.
+
+    With http_backend="httpx" (and httpx installed) the session is an
+    HTTP/2-capable httpx.Client, which multiplexes concurrent requests
+    over one TLS connection - a large win for scrapers hitting the same
+    host many times. httpx.Client exposes the same .get/.headers/.close
+    surface the callers here use, so the two backends are drop-in for
+    each other; if httpx is not installed the requests backend is used.
+
     Args:
         user_agent: User-Agent string to use
         additional_headers: Additional headers to include
-    
+        http_backend: "requests" (default) or "httpx"
+
     Returns:
-        Configured requests.Session
+        Configured requests.Session or httpx.Client
     """
+    headers = _default_headers(user_agent, additional_headers)
+
+    if http_backend == "httpx" and httpx is not None:
+        return httpx.Client(
+            http2=True,
+            headers=_httpx_headers(headers),
+            timeout=30,
+            limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_CONNECTIONS),
+        )
+
     session = requests.Session()
-    
-    # Set default headers
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "DNT": "1",  # Do Not Track
-        "Connection": "keep-alive",
-    }
-    
-    # Add any additional headers
-    if additional_headers:
-        headers.update(additional_headers)
-    
     session.headers.update(headers)
+    _mount_pooled_adapters(session)
+
+    return session
+
+
+def create_async_session(user_agent: str = DEFAULT_USER_AGENT) -> "httpx.AsyncClient":
+    """
+    Create an HTTP/2-capable async client for asyncio.gather fan-out.
+
+    Hundreds of concurrent requests to one host share a single
+    multiplexed connection instead of a pool of HTTP/1.1 sockets.
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    if httpx is None:
+        raise ImportError("httpx is not installed; run: pip install 'httpx[http2]'")
+    return httpx.AsyncClient(
+        http2=True,
+        headers=_httpx_headers(_default_headers(user_agent)),
+        timeout=30,
+        limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_CONNECTIONS),
+    )
+
+
+# Shared sessions handed out by get_session, closed together at exit
+_shared_sessions: List[requests.Session] = []
+
 
+@lru_cache(maxsize=None)
+def get_session(user_agent: str = DEFAULT_USER_AGENT) -> requests.Session:
+    """
+    Get a shared, connection-pooled session for the given User-Agent.
+
+    Sessions are cached per User-Agent so every client hitting the same host
+    reuses TCP/TLS connections instead of paying a handshake per instance.
+
+    Args:
+        user_agent: User-Agent string to use
+
+    Returns:
+        Shared requests.Session (do not close; it is reused across clients)
+    """
+    session = create_session(user_agent)
+    _shared_sessions.append(session)
     return session
 
 
+@atexit.register
+def _close_shared_sessions() -> None:
+    """Release pooled connections held by shared sessions at exit."""
+    for session in _shared_sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+def get_cached(
+    url: str,
+    session: Optional[requests.Session] = None,
+    timeout: int = 10,
+    **kwargs
+) -> bytes:
+    """
+    GET a URL with HTTP conditional-request caching.
+
+    The response body and its ETag/Last-Modified validators are stored under
+    scripts/http_cache/. Subsequent calls send If-None-Match /
+    If-Modified-Since, and a 304 Not Modified reuses the cached bytes without
+    re-downloading the payload.
+
+    Args:
+        url: URL to fetch
+        session: Optional pre-configured session
+        timeout: Request timeout in seconds
+        **kwargs: Additional arguments for session.get()
+
+    Returns:
+        Response body bytes (cached or fresh)
+
+    Raises:
+        requests.RequestException: If the request fails
+    """
+    if session is None:
+        session = get_session()
+
+    key = hashlib.sha1(url.encode()).hexdigest()
+    meta_path = HTTP_CACHE_DIR / f"{key}.meta.json"
+    body_path = HTTP_CACHE_DIR / f"{key}.body"
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if meta_path.exists() and body_path.exists():
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = session.get(url, headers=headers, timeout=timeout, **kwargs)
+    if response.status_code == 304:
+        return body_path.read_bytes()
+    response.raise_for_status()
+
+    HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    body_path.write_bytes(response.content)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            },
+            f,
+        )
+
+    return response.content
+
+
+def create_httpx_client(user_agent: str = DEFAULT_USER_AGENT) -> "httpx.Client":
+    """
+    Create an HTTP/2-capable httpx client.
+
+    HTTP/2 multiplexes concurrent requests over a single TCP connection,
+    which helps fetchers that pull many URLs from the same host.
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    if httpx is None:
+        raise ImportError("httpx is not installed; run: pip install 'httpx[http2]'")
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        headers={"User-Agent": user_agent},
+        timeout=30,
+    )
+
+
+def fetch_many(
+    urls: List[str],
+    user_agent: str = DEFAULT_USER_AGENT,
+    timeout: int = 15,
+) -> list:
+    """
+    Fetch many URLs concurrently.
+
+    Uses an async httpx client with HTTP/2 when available, otherwise a
+    thread pool over the shared pooled requests session. Failed fetches are
+    returned as exceptions in the corresponding slot rather than raised.
+
+    Returns:
+        List of responses (or exceptions), in the same order as urls
+    """
+    if not urls:
+        return []
+
+    if httpx is not None:
+        async def _fetch_all():
+            async with httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                headers={"User-Agent": user_agent},
+                timeout=timeout,
+            ) as client:
+                return await asyncio.gather(
+                    *(client.get(url) for url in urls),
+                    return_exceptions=True,
+                )
+
+        return asyncio.run(_fetch_all())
+
+    session = get_session(user_agent)
+
+    def _get(url):
+        try:
+            return session.get(url, timeout=timeout)
+        except requests.RequestException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+        return list(executor.map(_get, urls))
+
+
 def get_with_retry(
     url: str,
     session: Optional[requests.Session] = None,
@@ -70,12 +397,20 @@ def get_with_retry(
     """
     Make a GET request with retry logic.
 
+    Retriable HTTP statuses (429 and transient 5xx) are handled inside
+    the connection pool by the urllib3 Retry policy mounted in
+    create_session, which honors Retry-After and reuses the connection
+    across attempts. This wrapper only retries transport-level failures
+    (connection resets, timeouts) that surface as exceptions.
+
     Args:
         url: URL to fetch
-        session: Optional pre-configured session
+        session: Optional pre-configured session. When omitted, the shared
+                 default session is used; pass an explicit session if the
+                 caller needs cookie/header isolation.
         max_retries: Maximum number of retries
         backoff_factor: Backoff factor for retries
-        **kwargs: Additional arguments for requests.get(). 
+        **kwargs: Additional arguments for requests.get().
                  A default timeout of 10s is applied if not provided.
 
     Returns:
@@ -93,7 +428,9 @@ def get_with_retry(
         kwargs['timeout'] = 10
 
     if session is None:
-        session = create_session()
+        # Reuse the shared pool: building a fresh session per call would
+        # pay TCP/TLS setup on every request
+        session = get_session()
 
     last_exception: Optional[requests.RequestException] = None
 
@@ -102,12 +439,23 @@ def get_with_retry(
             response = session.get(url, **kwargs)
             response.raise_for_status()
             return response
+        except (requests.HTTPError, requests.exceptions.RetryError):
+            # A status error here already exhausted the in-pool retries
+            # (or is a non-retriable 4xx); RetryError is the pool
+            # reporting that exhaustion itself. Retrying either would
+            # multiply the configured attempts
+            raise
         except requests.RequestException as e:
             last_exception = e
             if attempt < max_retries - 1:
-                import time
-                sleep_time = backoff_factor * (2 ** attempt)
-                print(f"[HTTP] Retry {attempt + 1}/{max_retries} for {url} after {sleep_time}s")
+                # Capped exponential backoff with jitter so parallel fetchers
+                # retrying at once don't stampede the upstream in lockstep
+                sleep_time = min(RETRY_BACKOFF_CAP, backoff_factor * (2 ** attempt))
+                sleep_time *= random.uniform(0.5, 1.5)
+                logger.warning(
+                    "Retry %d/%d for %s after %.2fs: %s",
+                    attempt + 1, max_retries, url, sleep_time, e,
+                )
                 time.sleep(sleep_time)
             continue
 
@@ -120,12 +468,36 @@ def get_with_retry(
 class ConfScoutHTTPClient:
     """
     HTTP client for ConfScout scrapers with proper User-Agent headers.
+
+    An optional min_interval spaces request starts at least that many
+    seconds apart (thread-safe), for services with a politeness rate
+    limit. Only the actual inter-request gap is padded: a slow response
+    that already covers the interval costs no extra sleep.
     """
 
-    def __init__(self, user_agent: str = DEFAULT_USER_AGENT, timeout: int = 30):
-        self.session = create_session(user_agent)
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout: int = 30,
+        min_interval: float = 0.0,
+    ):
+        self.session = get_session(user_agent)
         self.request_count = 0
         self._default_timeout = timeout
+        self._min_interval = min_interval
+        self._pace_lock = threading.Lock()
+        self._next_request_time = 0.0
+
+    def _pace(self) -> None:
+        """Block until the next request slot when min_interval is set."""
+        if self._min_interval <= 0:
+            return
+        with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self._min_interval
+        if wait > 0:
+            time.sleep(wait)
 
     def get(self, url: str, **kwargs) -> requests.Response:
         """Make a GET request."""
@@ -133,6 +505,7 @@ class ConfScoutHTTPClient:
         # Apply default timeout if not provided
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self._default_timeout
+        self._pace()
         return self.session.get(url, **kwargs)
 
     def get_with_retry(self, url: str, **kwargs) -> requests.Response:
@@ -140,11 +513,79 @@ class ConfScoutHTTPClient:
         # Apply default timeout if not provided
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self._default_timeout
+        self._pace()
         return get_with_retry(url, self.session, **kwargs)
 
+    def _throttle(self) -> None:
+        """Per-request admission control for get_many fan-out.
+
+        Subclasses with their own politeness rules (e.g. the Nominatim
+        token bucket) extend this so concurrency never outruns them."""
+        self._pace()
+
+    def get_many(self, urls: List[str], timeout: Optional[int] = None) -> list:
+        """
+        Fetch many URLs concurrently with this client's headers.
+
+        Uses an async httpx client with HTTP/2 when available, so requests
+        to one host multiplex over a single connection; otherwise a thread
+        pool over the shared pooled session. Per-request throttling
+        (_throttle) still gates each URL, and failed fetches come back as
+        exceptions in the corresponding slot rather than raised.
+
+        Returns:
+            List of responses (or exceptions), in the same order as urls
+        """
+        if not urls:
+            return []
+        if timeout is None:
+            timeout = self._default_timeout
+        self.request_count += len(urls)
+        headers = dict(self.session.headers)
+
+        if httpx is not None:
+            headers = _httpx_headers(headers)
+            async def _fetch_all():
+                loop = asyncio.get_running_loop()
+                async with httpx.AsyncClient(
+                    http2=True,
+                    headers=headers,
+                    timeout=timeout,
+                    limits=httpx.Limits(
+                        max_connections=POOL_MAXSIZE,
+                        max_keepalive_connections=POOL_CONNECTIONS,
+                    ),
+                ) as client:
+                    async def _one(url):
+                        # Throttling may block (pacing sleep, token
+                        # bucket); run it in a worker thread so it never
+                        # stalls the event loop
+                        await loop.run_in_executor(None, self._throttle)
+                        return await client.get(url)
+
+                    return await asyncio.gather(
+                        *(_one(url) for url in urls),
+                        return_exceptions=True,
+                    )
+
+            return asyncio.run(_fetch_all())
+
+        def _get(url):
+            try:
+                self._throttle()
+                return self.session.get(url, timeout=timeout)
+            except requests.RequestException as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+            return list(executor.map(_get, urls))
+
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """Release the client. The shared session stays open for reuse."""
+        # The session comes from the get_session() cache and is shared across
+        # client instances; closing it here would drop pooled connections that
+        # other clients are still using.
+        pass
 
     def __enter__(self):
         return self
@@ -156,30 +597,45 @@ class ConfScoutHTTPClient:
 # Pre-configured clients for different services
 class GitHubHTTPClient(ConfScoutHTTPClient):
     """HTTP client optimized for GitHub API requests."""
-    
-    def __init__(self):
+
+    def __init__(self, concurrency: Optional[int] = None):
         super().__init__(user_agent=GITHUB_USER_AGENT)
-        self.session.headers.update({
-            "Accept": "application/vnd.github.v3+json",
-        })
+        # Always a dedicated session: the get_session() one is shared
+        # process-wide, and mutating its headers would leak the GitHub
+        # API Accept type into unrelated fetches reusing that session
+        self.session = create_session(
+            GITHUB_USER_AGENT,
+            additional_headers={"Accept": "application/vnd.github.v3+json"},
+        )
+        if concurrency is not None:
+            # Pool sized to the caller's fan-out, so wide asyncio/thread
+            # scrapes keep every socket
+            _mount_pooled_adapters(self.session, pool_maxsize=concurrency)
+
+    def close(self):
+        """Close the client's dedicated session."""
+        self.session.close()
+
+
+# One bucket per process: every NominatimHTTPClient instance draws from
+# it, so their aggregate rate honors Nominatim's 1 req/s ToS even when
+# several clients run on different threads
+_nominatim_bucket = SyncTokenBucket(rate=1.0, capacity=1)
 
 
 class NominatimHTTPClient(ConfScoutHTTPClient):
     """HTTP client for Nominatim geocoding (respects rate limits)."""
-    
+
     def __init__(self):
         super().__init__(user_agent=NOMINATIM_USER_AGENT)
-        self.last_request_time = 0
-    
+
     def get(self, url: str, **kwargs) -> requests.Response:
-        """Make a GET request with rate limiting (1 req/sec)."""
-        import time
-        
-        # Enforce 1 second delay between requests per Nominatim ToS
-        elapsed = time.time() - self.last_request_time
-        if elapsed < 1.0:
-            time.sleep(1.0 - elapsed)
-        
-        response = super().get(url, **kwargs)
-        self.last_request_time = time.time()
-        return response
+        """Make a GET request throttled by the shared process-wide bucket."""
+        _nominatim_bucket.consume(1)
+        return super().get(url, **kwargs)
+
+    def _throttle(self) -> None:
+        """Draw from the shared bucket before each get_many request, so
+        concurrent fan-out still honors the 1 req/s ToS in aggregate."""
+        _nominatim_bucket.consume(1)
+        super()._throttle()
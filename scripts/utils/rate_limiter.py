@@ -1,5 +1,7 @@
 import time
 import asyncio
+import threading
+from collections import deque
 from functools import wraps
 from typing import Callable
 from datetime import datetime, timedelta
@@ -9,36 +11,49 @@ class RateLimiter:
     def __init__(self, calls: int, period: float):
         self.calls = calls
         self.period = period
-        self.timestamps = []
+        # Bounded deque: expiry pops from the left in amortized O(1)
+        # instead of rebuilding a list on every acquire, and maxlen keeps
+        # memory constant for long-lived limiters - stale floats from an
+        # idle window are overwritten rather than retained
+        self.timestamps: deque = deque(maxlen=calls)
         self._lock = asyncio.Lock()
 
+    def _expire(self, now: float) -> None:
+        """Drop timestamps that have aged out of the window."""
+        while self.timestamps and now - self.timestamps[0] >= self.period:
+            self.timestamps.popleft()
+
     async def acquire(self):
-        async with self._lock:
-            now = time.time()
-            # Remove timestamps older than period
-            self.timestamps = [t for t in self.timestamps if now - t < self.period]
+        # Sleep outside the lock: a waiting coroutine must not block
+        # others that could still claim a free slot, so each pass claims
+        # or computes its wait under the lock and then releases it
+        while True:
+            async with self._lock:
+                # Monotonic clock: wall-clock jumps (NTP) must not warp
+                # the window
+                now = time.monotonic()
+                self._expire(now)
+
+                if len(self.timestamps) < self.calls:
+                    self.timestamps.append(now)
+                    return
 
-            if len(self.timestamps) >= self.calls:
-                # Calculate wait time
+                # Calculate wait time until the oldest slot expires
                 sleep_time = self.period - (now - self.timestamps[0])
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                    # Clean up old timestamps after waiting
-                    now = time.time()
-                    self.timestamps = [t for t in self.timestamps if now - t < self.period]
 
-            self.timestamps.append(now)
+            if sleep_time > 0:
+                await asyncio.sleep(sleep_time)
 
 
 def rate_limit(calls: int, period: float):
     def decorator(func: Callable):
+        # Built at decoration time: lazy first-call construction raced -
+        # two coroutines entering a cold wrapper could each build a
+        # limiter, with the second discarding the first's in-flight state
+        limiter = RateLimiter(calls, period)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            limiter = getattr(wrapper, '_limiter', None)
-            if limiter is None:
-                limiter = RateLimiter(calls, period)
-                wrapper._limiter = limiter
-
             await limiter.acquire()
             return await func(*args, **kwargs)
         return wrapper
@@ -46,37 +61,82 @@ def rate_limit(calls: int, period: float):
 
 
 class TokenBucket:
+    """
+    Async token bucket enforcing a sustained rate with bounded bursts.
+
+    Invariant: tokens only ever change by refill (elapsed * rate, capped
+    at capacity) or by an exact deduction on a successful consume - a
+    waiter never zeroes or force-sets the balance, so throughput cannot
+    exceed rate no matter how many coroutines wait concurrently.
+    """
+
     def __init__(self, rate: float, capacity: int):
         self.rate = rate
         self.capacity = capacity
         self.tokens = capacity
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self._lock = asyncio.Lock()
 
     async def consume(self, tokens: int = 1):
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_update = now
+        # Sleep outside the lock and re-derive the balance afterwards:
+        # zeroing the bucket after a sleep threw away refill earned while
+        # sleeping and double-charged concurrent waiters
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                elapsed = now - self.last_update
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self.last_update = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
 
-            if self.tokens < tokens:
                 wait_time = (tokens - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= tokens
+
+            await asyncio.sleep(wait_time)
+
+
+class SyncTokenBucket:
+    """
+    Thread-safe token bucket for synchronous callers.
+
+    Waiters block on a Condition (releasing the lock while they wait)
+    and re-derive the balance from elapsed monotonic time on wakeup, so
+    any number of clients sharing one bucket cooperate on a single
+    aggregate rate instead of each pacing independently.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_update = time.monotonic()
+        self._cond = threading.Condition()
+
+    def consume(self, tokens: int = 1):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self.last_update
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self.last_update = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                # Wait (lock released) until enough refill has accrued
+                self._cond.wait(timeout=(tokens - self.tokens) / self.rate)
 
 
 def token_bucket(rate: float, capacity: int):
     def decorator(func: Callable):
+        # Built at decoration time, mirroring rate_limit
+        bucket = TokenBucket(rate, capacity)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            bucket = getattr(wrapper, '_bucket', None)
-            if bucket is None:
-                bucket = TokenBucket(rate, capacity)
-                wrapper._bucket = bucket
-
             await bucket.consume()
             return await func(*args, **kwargs)
         return wrapper
@@ -1,41 +1,128 @@
 import asyncio
+import logging
 import random
-from typing import Callable, Type, Tuple, TypeVar
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Literal, Optional, Type, Tuple, TypeVar
 from functools import wraps
 
+# Lazy %-formatting: no string is built when the level is filtered out,
+# unlike the f-string prints this replaces
+log = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+JitterMode = Literal["none", "equal", "full"]
+
 
 class RetryError(Exception):
     pass
 
 
+@dataclass
+class _BreakerState:
+    """Consecutive-failure tracking for one decorated function.
+
+    Decorated functions run from thread-pooled fetchers, so every read
+    or write of this state goes through the lock."""
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _breaker_is_open(state: _BreakerState, threshold: Optional[int], cooldown: float) -> bool:
+    """True while the breaker should fail fast.
+
+    Once the cooldown passes, exactly one call is let through as a
+    half-open probe (marked via state.probing); other callers keep
+    failing fast until the probe's outcome resets or re-opens the
+    breaker."""
+    with state.lock:
+        if threshold is None or state.failures < threshold:
+            return False
+        if time.monotonic() - state.opened_at < cooldown:
+            return True
+        if state.probing:
+            return True
+        state.probing = True
+        return False
+
+
+def _breaker_record(state: _BreakerState, func_name: str) -> None:
+    """Count an exhausted retry ladder and (re)open the breaker window."""
+    with state.lock:
+        state.failures += 1
+        state.opened_at = time.monotonic()
+        state.probing = False
+        failures = state.failures
+    log.warning("Retries exhausted for %s (%d consecutive)", func_name, failures)
+
+
+def _breaker_reset(state: _BreakerState) -> None:
+    """Close the breaker after a successful call."""
+    with state.lock:
+        state.failures = 0
+        state.probing = False
+
+
+def _delay_table(
+    max_attempts: int,
+    base_delay: float,
+    max_delay: float,
+    exponential_base: float,
+) -> Tuple[float, ...]:
+    """Capped exponential delays indexed by attempt, computed once up
+    front instead of a pow per failure - and trivially loggable."""
+    return tuple(
+        min(base_delay * (exponential_base ** attempt), max_delay)
+        for attempt in range(max_attempts)
+    )
+
+
+def _apply_jitter(capped: float, jitter_mode: JitterMode, rng: Optional[random.Random]) -> float:
+    """
+    Jitter a capped delay. Default is full jitter - uniform over
+    [0, capped) - which spreads simultaneous retriers across the whole
+    window instead of clustering them in its top half like equal jitter.
+    """
+    if jitter_mode == "none":
+        return capped
+    r = (rng or random).random()
+    if jitter_mode == "equal":
+        return capped * (0.5 + r * 0.5)
+    return capped * r
+
+
 async def retry_with_backoff(
     func: Callable,
     max_attempts: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 10.0,
     exponential_base: float = 2,
-    jitter: bool = True,
+    jitter_mode: JitterMode = "full",
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    rng: Optional[random.Random] = None,
 ) -> T:
     last_exception = None
+    delays = _delay_table(max_attempts, base_delay, max_delay, exponential_base)
 
     for attempt in range(max_attempts):
         try:
             return await func()
         except exceptions as e:
             last_exception = e
-            
+
             if attempt == max_attempts - 1:
                 break
 
-            delay = min(base_delay * (exponential_base ** attempt), max_delay)
-            if jitter:
-                delay *= (0.5 + random.random() * 0.5)
+            delay = _apply_jitter(delays[attempt], jitter_mode, rng)
 
-            print(f"[RETRY] Attempt {attempt + 1}/{max_attempts} failed: {str(e)}. Retrying in {delay:.2f}s...")
+            log.warning(
+                "Attempt %d/%d failed: %s. Retrying in %.2fs",
+                attempt + 1, max_attempts, e, delay,
+            )
             await asyncio.sleep(delay)
 
     raise RetryError(f"All {max_attempts} attempts failed") from last_exception
@@ -46,24 +133,47 @@ def retry_async(
     base_delay: float = 1.0,
     max_delay: float = 10.0,
     exponential_base: float = 2,
-    jitter: bool = True,
+    jitter_mode: JitterMode = "full",
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    rng: Optional[random.Random] = None,
+    breaker_threshold: Optional[int] = None,
+    breaker_cooldown: float = 60.0,
 ):
+    """
+    Retry decorator for async functions.
+
+    With breaker_threshold set, that many consecutive exhausted retry
+    ladders open a circuit breaker: calls fail fast with RetryError for
+    breaker_cooldown seconds instead of grinding through the full
+    backoff ladder against an upstream that is clearly down.
+    """
     def decorator(func: Callable):
+        state = _BreakerState()
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
+            if _breaker_is_open(state, breaker_threshold, breaker_cooldown):
+                raise RetryError(f"Circuit open for {func.__name__}; failing fast")
+
             async def attempt():
                 return await func(*args, **kwargs)
-            
-            return await retry_with_backoff(
-                attempt,
-                max_attempts=max_attempts,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                exponential_base=exponential_base,
-                jitter=jitter,
-                exceptions=exceptions,
-            )
+
+            try:
+                result = await retry_with_backoff(
+                    attempt,
+                    max_attempts=max_attempts,
+                    base_delay=base_delay,
+                    max_delay=max_delay,
+                    exponential_base=exponential_base,
+                    jitter_mode=jitter_mode,
+                    exceptions=exceptions,
+                    rng=rng,
+                )
+            except RetryError:
+                _breaker_record(state, func.__name__)
+                raise
+            _breaker_reset(state)
+            return result
         return wrapper
     return decorator
 
@@ -73,31 +183,49 @@ def retry_sync(
     base_delay: float = 1.0,
     max_delay: float = 10.0,
     exponential_base: float = 2,
-    jitter: bool = True,
+    jitter_mode: JitterMode = "full",
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    rng: Optional[random.Random] = None,
+    breaker_threshold: Optional[int] = None,
+    breaker_cooldown: float = 60.0,
 ):
+    """
+    Retry decorator for sync functions. See retry_async for the circuit
+    breaker semantics enabled by breaker_threshold.
+    """
     def decorator(func: Callable):
+        state = _BreakerState()
+        # Fixed per decoration, so the ladder is computed exactly once
+        delays = _delay_table(max_attempts, base_delay, max_delay, exponential_base)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            import time
+            if _breaker_is_open(state, breaker_threshold, breaker_cooldown):
+                raise RetryError(f"Circuit open for {func.__name__}; failing fast")
+
             last_exception = None
 
             for attempt in range(max_attempts):
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    
+
                     if attempt == max_attempts - 1:
                         break
 
-                    delay = min(base_delay * (exponential_base ** attempt), max_delay)
-                    if jitter:
-                        delay *= (0.5 + random.random() * 0.5)
+                    delay = _apply_jitter(delays[attempt], jitter_mode, rng)
 
-                    print(f"[RETRY] Attempt {attempt + 1}/{max_attempts} failed: {str(e)}. Retrying in {delay:.2f}s...")
+                    log.warning(
+                        "Attempt %d/%d failed: %s. Retrying in %.2fs",
+                        attempt + 1, max_attempts, e, delay,
+                    )
                     time.sleep(delay)
+                else:
+                    _breaker_reset(state)
+                    return result
 
+            _breaker_record(state, func.__name__)
             raise RetryError(f"All {max_attempts} attempts failed") from last_exception
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator